@@ -0,0 +1,188 @@
+"""Latency benchmarks for the Smart Matic client, against simulated devices.
+
+Run from the repository root:
+
+    python -m benchmarks.benchmark --devices 40 --slots 3
+
+With ``--trace trace.json`` every phase is traced as well, the file opens
+in chrome://tracing or https://ui.perfetto.dev.
+
+Only the godrej package is imported, so Home Assistant does not need to be
+installed.
+"""
+import argparse
+import asyncio
+import pathlib
+import statistics
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components" / "godrej_aer"))
+
+from godrej.connectionpolicy import POLICIES, POLICY_FIXED  # noqa: E402
+from godrej.fleet import trigger_all  # noqa: E402
+from godrej.scheduler import ConnectionScheduler  # noqa: E402
+from godrej.tracing import Tracer  # noqa: E402
+from tests.simulator import (  # noqa: E402
+    FakeSmartMaticDevice,
+    SimulatedSmartMatic
+)
+
+
+def _summary(name: str, samples: list[float]):
+    if not samples:
+        print(f"{name:<24} no samples")
+        return
+    ordered = sorted(samples)
+    p90 = ordered[min(len(ordered) - 1, int(0.9 * len(ordered)))]
+    print(
+        f"{name:<24} n={len(samples):<4} "
+        f"p50={statistics.median(samples) * 1000:8.1f}ms "
+        f"p90={p90 * 1000:8.1f}ms "
+        f"max={ordered[-1] * 1000:8.1f}ms"
+    )
+
+
+def _device(args, index: int, source: str = "simulated") -> FakeSmartMaticDevice:
+    return FakeSmartMaticDevice(
+        f"00:00:00:00:{index // 256:02X}:{index % 256:02X}",
+        source=source,
+        connect_delay=args.connect_delay,
+        response_delay=args.response_delay,
+        write_delay=args.write_delay,
+        mtu=args.mtu,
+        drop_rate=args.drop_rate,
+        disconnect_rate=args.disconnect_rate,
+        seed=index
+    )
+
+
+def _smartmatic(args, device, scheduler=None) -> SimulatedSmartMatic:
+    smartmatic = SimulatedSmartMatic(device, scheduler, slots=args.slots)
+    smartmatic.status_timeout = args.status_timeout
+    smartmatic.write_without_response = not args.acknowledged_writes
+    smartmatic.connection_policy.policy = args.policy
+    smartmatic.connection_policy.idle_timeout = args.disconnect_delay
+    smartmatic.tracer = args.tracer
+    # Benchmarks measure single operations, never back off between them
+    smartmatic.retry_policy.failure_threshold = 1 << 30
+    smartmatic.retry_policy.base_delay = 0
+    return smartmatic
+
+
+async def _timed(coro) -> float | None:
+    started = time.perf_counter()
+    try:
+        await coro
+    except Exception:
+        return None
+    return time.perf_counter() - started
+
+
+async def bench_cold_trigger(args) -> list[float]:
+    """Trigger from disconnected: connect, status read, trigger write."""
+    samples = []
+    for i in range(args.iterations):
+        smartmatic = _smartmatic(args, _device(args, i))
+        elapsed = await _timed(smartmatic.trigger())
+        if elapsed is not None:
+            samples.append(elapsed)
+        await smartmatic.close()
+    return samples
+
+
+async def bench_warm_trigger(args) -> list[float]:
+    smartmatic = _smartmatic(args, _device(args, 0))
+    smartmatic.connection_policy.idle_timeout = 3600
+    samples = []
+    try:
+        await smartmatic.connect()
+        for _ in range(args.iterations):
+            elapsed = await _timed(smartmatic.trigger())
+            if elapsed is not None:
+                samples.append(elapsed)
+    finally:
+        await smartmatic.close()
+    return samples
+
+
+async def bench_status_round_trip(args) -> list[float]:
+    smartmatic = _smartmatic(args, _device(args, 0))
+    smartmatic.connection_policy.idle_timeout = 3600
+    samples = []
+    try:
+        await smartmatic.connect()
+        for _ in range(args.iterations):
+            elapsed = await _timed(smartmatic.get_device_status())
+            if elapsed is not None:
+                samples.append(elapsed)
+    finally:
+        await smartmatic.close()
+    return samples
+
+
+async def bench_fleet(args) -> tuple[float, list[float]]:
+    """Trigger every device at once, spread over the given proxies."""
+    scheduler = ConnectionScheduler()
+    smartmatics = [
+        _smartmatic(args, _device(args, i, f"proxy-{i % args.proxies}"), scheduler)
+        for i in range(args.devices)
+    ]
+    started = time.perf_counter()
+    results = await trigger_all(smartmatics, max_parallel=args.max_parallel)
+    elapsed = time.perf_counter() - started
+    await asyncio.gather(*[smartmatic.close() for smartmatic in smartmatics])
+    return elapsed, [result.latency for result in results if result.success]
+
+
+async def main(args):
+    _summary("cold trigger", await bench_cold_trigger(args))
+    _summary("warm trigger", await bench_warm_trigger(args))
+    _summary("status round trip", await bench_status_round_trip(args))
+
+    elapsed, samples = await bench_fleet(args)
+    _summary(f"fleet trigger x{args.devices}", samples)
+    print(
+        f"{'fleet throughput':<24} {len(samples)}/{args.devices} devices "
+        f"in {elapsed:.2f}s ({len(samples) / elapsed:.1f} devices/s)"
+    )
+
+    if args.tracer is not None:
+        for name, summary in args.tracer.summary().items():
+            print(
+                f"{'  ' + name:<24} n={summary['count']:<5} "
+                f"p50={summary['p50'] * 1000:8.1f}ms p99={summary['p99'] * 1000:8.1f}ms "
+                f"max={summary['max'] * 1000:8.1f}ms"
+            )
+        args.tracer.write_chrome_trace(args.trace)
+        print(f"Trace written to {args.trace}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--devices", type=int, default=40)
+    parser.add_argument("--proxies", type=int, default=4)
+    parser.add_argument("--slots", type=int, default=3)
+    parser.add_argument("--max-parallel", type=int, default=64)
+    parser.add_argument("--connect-delay", type=float, default=0.5)
+    parser.add_argument("--response-delay", type=float, default=0.05)
+    parser.add_argument("--write-delay", type=float, default=0.05)
+    parser.add_argument("--mtu", type=int, default=23)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--disconnect-rate", type=float, default=0.0)
+    parser.add_argument("--status-timeout", type=float, default=2.0)
+    parser.add_argument("--disconnect-delay", type=float, default=0.0)
+    parser.add_argument("--policy", choices=POLICIES, default=POLICY_FIXED)
+    parser.add_argument(
+        "--acknowledged-writes", action="store_true",
+        help="Wait for a write response even where write-without-response is allowed"
+    )
+    parser.add_argument("--trace", metavar="PATH", help="Write a Chrome trace of every phase to PATH")
+    args = parser.parse_args()
+    args.tracer = Tracer() if args.trace else None
+    return args
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,91 @@
+"""Replay BLE captures through SmartMatic's notification handling.
+
+Run from the repository root:
+
+    python -m benchmarks.replay kitchen.capture hallway.capture --speed 1
+    python -m benchmarks.replay --generate synthetic.capture --cycles 1000
+
+Captures are recorded by the integration when "Record BLE traffic" is
+enabled in a device's options, --generate records one from a simulated
+device instead.
+"""
+import argparse
+import asyncio
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components" / "godrej_aer"))
+
+from godrej import SmartMatic, StaticResolver  # noqa: E402
+from godrej.capture import CaptureWriter, read_capture, replay  # noqa: E402
+from tests.simulator import FakeSmartMaticDevice, SimulatedSmartMatic  # noqa: E402
+
+
+async def generate(args):
+    device = FakeSmartMaticDevice(
+        "00:00:00:00:00:01",
+        connect_delay=0,
+        response_delay=0,
+        write_delay=0,
+        mtu=args.mtu,
+        drop_rate=args.drop_rate,
+        seed=0
+    )
+    smartmatic = SimulatedSmartMatic(device)
+    smartmatic.status_timeout = 0.5
+    smartmatic.connection_policy.idle_timeout = 3600
+    smartmatic.capture = CaptureWriter(args.generate, device.address)
+    try:
+        await smartmatic.connect()
+        for cycle in range(args.cycles):
+            device.battery_mv = 3000 - cycle % 500
+            try:
+                await smartmatic.trigger(read_status=True)
+            except Exception as e:
+                print(f"cycle {cycle}: {e}")
+    finally:
+        await smartmatic.close()
+    print(f"wrote {args.generate}")
+
+
+async def replay_file(path: str, speed: float | None):
+    smartmatic = SmartMatic(StaticResolver(), "00:00:00:00:00:00")
+    started = time.perf_counter()
+    stats = await replay(smartmatic, read_capture(path), speed)
+    elapsed = time.perf_counter() - started
+    per_notification = stats.handler_seconds / stats.notifications if stats.notifications else 0
+    print(
+        f"{path}: {stats.records} records, {stats.writes} writes, "
+        f"{stats.notifications} notifications, {stats.statuses} statuses decoded "
+        f"in {elapsed:.2f}s ({per_notification * 1e6:.1f}us per notification)"
+    )
+    if smartmatic.device_status is not None:
+        print(f"  last battery voltage: {smartmatic.device_status.battery_mv} mV")
+    smartmatic.eventbus.close()
+
+
+async def main(args):
+    if args.generate:
+        await generate(args)
+        return
+    for path in args.captures:
+        await replay_file(path, args.speed)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("captures", nargs="*")
+    parser.add_argument(
+        "--speed", type=float, default=None,
+        help="1 replays in real time, 10 ten times faster, default as fast as possible"
+    )
+    parser.add_argument("--generate", metavar="PATH")
+    parser.add_argument("--cycles", type=int, default=100)
+    parser.add_argument("--mtu", type=int, default=23)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -1,15 +1,43 @@
 """The Qingping CGD1 Alarm Clock integration."""
 from __future__ import annotations
-import asyncio
 import logging
+import os
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform, CONF_MAC
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth.match import ADDRESS, BluetoothCallbackMatcher
-
-from .godrej import SmartMatic
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    DOMAIN,
+    CONF_ADVERTISEMENT_DEBOUNCE,
+    CONF_CAPTURE,
+    CONF_CONNECTION_POLICY,
+    CONF_IDLE_TIMEOUT,
+    CONF_JOURNAL_TTL,
+    CONF_OFFLINE_JOURNAL,
+    CONF_TRACE,
+    CONF_TRIGGER_COALESCE_WINDOW,
+    DEFAULT_ADVERTISEMENT_DEBOUNCE,
+    DEFAULT_CONNECTION_POLICY,
+    DEFAULT_IDLE_TIMEOUT,
+    DEFAULT_JOURNAL_TTL,
+    DEFAULT_TRIGGER_COALESCE_WINDOW
+)
+from .battery_statistics import BatteryStatisticsImporter
+from .coordinator import SmartMaticCoordinator
+from .godrej import SmartMatic, DeviceStatus
+from .godrej.capture import CaptureWriter
+from .godrej.journal import CommandJournal
+from .godrej.scheduler import ConnectionScheduler
+from .godrej.tracing import Tracer
+from .resolver import async_get_resolver
+from .services import async_setup_services
+from .storage import async_get_storage
+from .warmup import async_get_warmup_planner
 
 _LOGGER = logging.getLogger(__name__)
 PLATFORMS: list[Platform] = [
@@ -17,6 +45,12 @@ PLATFORMS: list[Platform] = [
     Platform.BUTTON,
     Platform.BINARY_SENSOR
 ]
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the services shared by all Smart Matic devices."""
+    async_setup_services(hass)
+    return True
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,39 +60,61 @@ async def async_setup_entry(
 
     mac = entry.options.get(CONF_MAC, None) or entry.data.get(CONF_MAC, None)
 
-    instance = SmartMatic(hass, mac)
+    instance = SmartMatic(async_get_resolver(hass), mac, async_get_scheduler(hass))
+    instance.commands.coalesce_window = entry.options.get(
+        CONF_TRIGGER_COALESCE_WINDOW, DEFAULT_TRIGGER_COALESCE_WINDOW
+    )
+    _apply_connection_policy(instance, entry)
+    _apply_tracing(hass, instance, entry)
     entry.runtime_data = instance
 
-    async def _connect_if_needed():
-        if bluetooth.async_address_present(hass, mac, connectable=True):
-            try:
-                await instance.connect_if_needed()
-            except:
-                # Fail silently, since this is running in the background
-                pass
-
-    @callback
-    def _async_discovered_device(
-        service_info: bluetooth.BluetoothServiceInfoBleak,
-        change: bluetooth.BluetoothChange
-    ):
-        """Subscribe to bluetooth changes."""
-        _LOGGER.debug("New service_info: %s", service_info)
-        hass.loop.create_task(_connect_if_needed())
+    storage = await async_get_storage(hass)
+    if stored_status := storage.get(mac, "status"):
+        try:
+            instance.device_status = DeviceStatus.from_dict(stored_status)
+        except (KeyError, TypeError, ValueError) as e:
+            _LOGGER.warning("Ignoring the stored status of %s: %s", mac, e)
+    instance.on_device_status = lambda device_status: storage.set(
+        mac, "status", device_status.as_dict()
+    )
+
+    if entry.options.get(CONF_OFFLINE_JOURNAL, False):
+        instance.journal = CommandJournal(
+            ttl=entry.options.get(CONF_JOURNAL_TTL, DEFAULT_JOURNAL_TTL),
+            on_change=lambda journal: storage.set(mac, "journal", journal.as_list())
+        )
+        instance.journal.load(storage.get(mac, "journal", []))
+
+    if entry.options.get(CONF_CAPTURE, False):
+        capture_dir = hass.config.path(DOMAIN)
+        await hass.async_add_executor_job(lambda: os.makedirs(capture_dir, exist_ok=True))
+        capture_path = os.path.join(capture_dir, f"{mac.replace(':', '').lower()}.capture")
+        _LOGGER.info("Recording the BLE traffic of %s to %s", mac, capture_path)
+        instance.capture = CaptureWriter(capture_path, mac)
+
+    coordinator = SmartMaticCoordinator(hass, entry, instance)
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
     entry.async_on_unload(
         bluetooth.async_register_callback(
             hass,
-            _async_discovered_device,
+            coordinator.async_handle_advertisement,
             BluetoothCallbackMatcher({ADDRESS: mac}),
             bluetooth.BluetoothScanningMode.PASSIVE
         )
     )
 
+    battery_statistics = BatteryStatisticsImporter(hass, entry, instance)
+    battery_statistics.async_start()
+    entry.async_on_unload(battery_statistics.async_stop)
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
-    await set_interval(60, _connect_if_needed)
+    planner = async_get_warmup_planner(hass)
+    planner.async_register(coordinator)
+    entry.async_on_unload(lambda: planner.async_unregister(coordinator))
+    entry.async_on_unload(coordinator.async_shutdown)
 
     return True
 
@@ -67,22 +123,62 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         instance: SmartMatic = entry.runtime_data
-        await instance.disconnect()
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await instance.close()
     return unload_ok
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the stored state of a removed device."""
+    mac = entry.options.get(CONF_MAC, None) or entry.data.get(CONF_MAC, None)
+    storage = await async_get_storage(hass)
+    storage.remove(mac)
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> ConnectionScheduler:
+    """Return the connection scheduler shared by all Smart Matic devices."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "scheduler" not in domain_data:
+        domain_data["scheduler"] = ConnectionScheduler()
+    return domain_data["scheduler"]
+
+@callback
+def async_get_tracer(hass: HomeAssistant) -> Tracer:
+    """Return the tracer shared by the Smart Matic devices that have tracing on."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "tracer" not in domain_data:
+        domain_data["tracer"] = Tracer()
+    return domain_data["tracer"]
+
+def _apply_tracing(hass: HomeAssistant, instance: SmartMatic, entry: ConfigEntry):
+    instance.tracer = async_get_tracer(hass) if entry.options.get(CONF_TRACE, False) else None
+
+def _apply_connection_policy(instance: SmartMatic, entry: ConfigEntry):
+    instance.connection_policy.policy = entry.options.get(
+        CONF_CONNECTION_POLICY, DEFAULT_CONNECTION_POLICY
+    )
+    instance.connection_policy.idle_timeout = entry.options.get(
+        CONF_IDLE_TIMEOUT, DEFAULT_IDLE_TIMEOUT
+    )
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
-    instance: SmartMatic = entry.runtime_data
-    pass
-
-async def set_interval(interval, coro, *args, **kwargs):
-        async def interval_runner():
-            while True:
-                await asyncio.sleep(interval)
-
-                try:
-                    await coro(*args, **kwargs)
-                except Exception as e:
-                    _LOGGER.error(e, exc_info=True)
-
-        asyncio.create_task(interval_runner())
\ No newline at end of file
+    coordinator: SmartMaticCoordinator = hass.data[DOMAIN][entry.entry_id]
+    instance = coordinator.instance
+    if (instance.journal is not None) != entry.options.get(CONF_OFFLINE_JOURNAL, False) or \
+            (instance.capture is not None) != entry.options.get(CONF_CAPTURE, False):
+        # The journal and the capture are wired up during setup
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    coordinator.debounce = entry.options.get(
+        CONF_ADVERTISEMENT_DEBOUNCE, DEFAULT_ADVERTISEMENT_DEBOUNCE
+    )
+    instance.commands.coalesce_window = entry.options.get(
+        CONF_TRIGGER_COALESCE_WINDOW, DEFAULT_TRIGGER_COALESCE_WINDOW
+    )
+    if instance.journal is not None:
+        instance.journal.ttl = entry.options.get(CONF_JOURNAL_TTL, DEFAULT_JOURNAL_TTL)
+    _apply_connection_policy(instance, entry)
+    _apply_tracing(hass, instance, entry)
+    # Re-arm the idle timer under the new policy
+    await instance.delayed_disconnect()
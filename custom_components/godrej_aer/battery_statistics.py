@@ -0,0 +1,78 @@
+"""Long-term battery statistics of the Smart Matic devices."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import UnitOfElectricPotential, CONF_NAME
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+
+from .const import DOMAIN, BATTERY_STATISTICS_MINUTE
+from .godrej import SmartMatic
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # Older Home Assistant, has_mean instead
+    StatisticMeanType = None
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def battery_statistic_id(mac: str) -> str:
+    return f"{DOMAIN}:battery_voltage_{mac.replace(':', '').lower()}"
+
+
+class BatteryStatisticsImporter:
+    """Imports hourly min/mean/max battery voltage as external statistics.
+
+    The samples come from the device's in-memory BatteryHistory. Each
+    complete hour is written once, shortly after it ends, so the recorder
+    gets one row per device and hour however often the status changes.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, instance: SmartMatic):
+        self.hass = hass
+        self.instance = instance
+        self.statistic_id = battery_statistic_id(instance.mac)
+        self.metadata = {
+            "source": DOMAIN,
+            "statistic_id": self.statistic_id,
+            "name": f"{entry.data[CONF_NAME]} Battery Voltage",
+            "unit_of_measurement": UnitOfElectricPotential.MILLIVOLT,
+            "has_sum": False
+        }
+        if StatisticMeanType is not None:
+            self.metadata["mean_type"] = StatisticMeanType.ARITHMETIC
+        else:
+            self.metadata["has_mean"] = True
+        self._imported_until: datetime | None = None
+        self._unsub = None
+
+    @callback
+    def async_start(self):
+        self._unsub = async_track_time_change(
+            self.hass, self._async_import, minute=BATTERY_STATISTICS_MINUTE, second=0
+        )
+
+    @callback
+    def async_stop(self):
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        # Hand over the complete hours that are still pending
+        self._async_import()
+
+    @callback
+    def _async_import(self, _now: datetime | None = None):
+        until = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        hours = self.instance.battery.hourly(since=self._imported_until, until=until)
+        if not hours:
+            return
+        _LOGGER.debug(
+            "Importing %s hours of battery statistics for %s", len(hours), self.instance.mac
+        )
+        async_add_external_statistics(self.hass, self.metadata, hours)
+        self._imported_until = hours[-1]["start"] + timedelta(hours=1)
@@ -1,47 +1,92 @@
 from __future__ import annotations
 
+import time
+
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.const import CONF_NAME
 from homeassistant.helpers.entity import EntityCategory, DeviceInfo
+from homeassistant.helpers.event import async_call_later
 
 from .entity import async_device_device_info_fn
 from .godrej import SmartMatic
-from .godrej.events import DEVICE_DISCONNECT, DEVICE_CONNECT
+from .godrej.events import DEVICE_REACHABILITY
+from .godrej.reachability import Reachability
+
+MIN_WRITE_INTERVAL = 60  # Seconds between two state writes
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     instance: SmartMatic = config_entry.runtime_data
     async_add_entities([
-        SmartMaticConnectedBinarySensor(instance, config_entry)
+        SmartMaticReachableBinarySensor(instance, config_entry)
     ])
 
 
-class SmartMaticConnectedBinarySensor(BinarySensorEntity):
-    """Representation of a Qingping Connected Binary Sensor."""
+class SmartMaticReachableBinarySensor(BinarySensorEntity):
+    """Whether the Smart Matic is in Bluetooth range.
+
+    Follows the advertisement based reachability rather than the GATT
+    connection, which comes and goes with every poll. State changes are
+    written at most once per MIN_WRITE_INTERVAL, a change that reverts
+    within that time is never written at all.
+    """
 
     def __init__(self, instance: SmartMatic, config_entry: ConfigEntry):
         self._instance: SmartMatic = instance
         self._config_entry = config_entry
-        self._attr_name = f"{config_entry.data[CONF_NAME]} Connected"
+        self._attr_name = f"{config_entry.data[CONF_NAME]} Reachable"
+        # Kept from when this sensor followed the connection
         self._attr_unique_id = f"{config_entry.data[CONF_NAME]}_is_connected"
         self._attr_device_class = "connectivity"
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_is_on = False
-        self._attr_icon = "mdi:bluetooth-off"
+        self._set_state(instance.reachability.reachable)
+        self._last_write = 0.0
+        self._cancel_write = None
 
-        instance.eventbus.add_listener(DEVICE_CONNECT, self.on_connect)
-        instance.eventbus.add_listener(DEVICE_DISCONNECT, self.on_disconnect)
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(self._instance.eventbus.add_listener(
+            DEVICE_REACHABILITY,
+            self.on_reachability
+        ))
+        self.async_on_remove(self._async_cancel_write)
 
     @property
     def device_info(self) -> DeviceInfo:
         return async_device_device_info_fn(self._instance, self._config_entry.data[CONF_NAME])
 
-    async def on_connect(self, instance: SmartMatic):
-        self._attr_is_on = True
-        self._attr_icon = "mdi:bluetooth-connect"
-        self.schedule_update_ha_state()
+    def _set_state(self, reachable: bool):
+        self._attr_is_on = reachable
+        self._attr_icon = "mdi:bluetooth" if reachable else "mdi:bluetooth-off"
+
+    @callback
+    def on_reachability(self, reachability: Reachability):
+        if self._cancel_write is not None:
+            # Already waiting, the deferred write picks the latest state up
+            return
+        wait = self._last_write + MIN_WRITE_INTERVAL - time.monotonic()
+        if wait > 0:
+            self._cancel_write = async_call_later(self.hass, wait, self._async_deferred_write)
+            return
+        self._async_write_state()
+
+    @callback
+    def _async_deferred_write(self, _now):
+        self._cancel_write = None
+        self._async_write_state()
+
+    @callback
+    def _async_write_state(self):
+        reachable = self._instance.reachability.reachable
+        if reachable == self._attr_is_on:
+            return
+        self._set_state(reachable)
+        self._last_write = time.monotonic()
+        self.async_write_ha_state()
 
-    async def on_disconnect(self, instance: SmartMatic):
-        self._attr_is_on = False
-        self._attr_icon = "mdi:bluetooth-off"
-        self.schedule_update_ha_state()
+    @callback
+    def _async_cancel_write(self):
+        if self._cancel_write is not None:
+            self._cancel_write()
+            self._cancel_write = None
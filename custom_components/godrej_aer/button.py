@@ -4,11 +4,13 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.const import CONF_NAME
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .entity import async_device_device_info_fn
 from .godrej import SmartMatic
+from .godrej.exception import SmartMaticError
 
 
 async def async_setup_entry(
@@ -37,4 +39,7 @@ class SmartMaticButton(ButtonEntity):
         return async_device_device_info_fn(self._instance, self._config_entry.data[CONF_NAME])
 
     async def async_press(self) -> None:
-        await self._instance.trigger()
+        try:
+            await self._instance.trigger()
+        except SmartMaticError as e:
+            raise HomeAssistantError(str(e)) from e
@@ -7,20 +7,52 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow
+)
 from homeassistant.const import CONF_MAC, CONF_NAME
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import format_mac
 from homeassistant.components.bluetooth import (
     async_discovered_service_info
 )
 
-from .const import DOMAIN
+from . import async_get_scheduler
+from .const import (
+    DOMAIN,
+    CONF_ADVERTISEMENT_DEBOUNCE,
+    CONF_CAPTURE,
+    CONF_CONNECTION_POLICY,
+    CONF_IDLE_TIMEOUT,
+    CONF_JOURNAL_TTL,
+    CONF_OFFLINE_JOURNAL,
+    CONF_TRACE,
+    CONF_TRIGGER_COALESCE_WINDOW,
+    CONF_WARMUP_WINDOW,
+    DEFAULT_ADVERTISEMENT_DEBOUNCE,
+    DEFAULT_CONNECTION_POLICY,
+    DEFAULT_IDLE_TIMEOUT,
+    DEFAULT_JOURNAL_TTL,
+    DEFAULT_TRIGGER_COALESCE_WINDOW,
+    DEFAULT_WARMUP_WINDOW
+)
 from .godrej import SmartMatic
+from .godrej.connectionpolicy import POLICY_ADAPTIVE, POLICY_ALWAYS, POLICY_FIXED
+from .resolver import async_get_resolver
 
 _LOGGER = logging.getLogger(__name__)
 
 MANUAL_MAC = "manual_mac"
 
+CONNECTION_POLICIES = {
+    POLICY_FIXED: "Disconnect after a fixed idle time",
+    POLICY_ADAPTIVE: "Learn the idle time from how often it is used",
+    POLICY_ALWAYS: "Stay connected"
+}
+
 
 class GodrejAerConfigFlow(ConfigFlow, domain=DOMAIN):
     VERSION = 1
@@ -29,6 +61,11 @@ class GodrejAerConfigFlow(ConfigFlow, domain=DOMAIN):
         self.name = "Godrej Aer Smart Matic"
         self.mac = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        return GodrejAerOptionsFlow()
+
     def _is_device_supported(self, device_info):
         return "smart matic" in device_info.name.lower()
 
@@ -100,7 +137,11 @@ class GodrejAerConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """Handle validate step."""
         error = None
-        smartmatic = SmartMatic(self.hass, self.mac)
+        smartmatic = SmartMatic(
+            async_get_resolver(self.hass),
+            self.mac,
+            async_get_scheduler(self.hass)
+        )
         try:
             error = await self._validate_device(smartmatic)
         except Exception as e:
@@ -136,4 +177,57 @@ class GodrejAerConfigFlow(ConfigFlow, domain=DOMAIN):
                 }
             ),
             errors={},
-        )
\ No newline at end of file
+        )
+
+
+class GodrejAerOptionsFlow(OptionsFlow):
+    """Per-device connection and timing options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        options = self.config_entry.options
+        if user_input is not None:
+            return self.async_create_entry(data={**options, **user_input})
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_CONNECTION_POLICY,
+                    default=options.get(CONF_CONNECTION_POLICY, DEFAULT_CONNECTION_POLICY)
+                ): vol.In(CONNECTION_POLICIES),
+                vol.Required(
+                    CONF_IDLE_TIMEOUT,
+                    default=options.get(CONF_IDLE_TIMEOUT, DEFAULT_IDLE_TIMEOUT)
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                vol.Required(
+                    CONF_ADVERTISEMENT_DEBOUNCE,
+                    default=options.get(CONF_ADVERTISEMENT_DEBOUNCE, DEFAULT_ADVERTISEMENT_DEBOUNCE)
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=300)),
+                vol.Required(
+                    CONF_TRIGGER_COALESCE_WINDOW,
+                    default=options.get(CONF_TRIGGER_COALESCE_WINDOW, DEFAULT_TRIGGER_COALESCE_WINDOW)
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=300)),
+                vol.Required(
+                    CONF_OFFLINE_JOURNAL,
+                    default=options.get(CONF_OFFLINE_JOURNAL, False)
+                ): bool,
+                vol.Required(
+                    CONF_JOURNAL_TTL,
+                    default=options.get(CONF_JOURNAL_TTL, DEFAULT_JOURNAL_TTL)
+                ): vol.All(vol.Coerce(int), vol.Range(min=60, max=86400)),
+                vol.Required(
+                    CONF_WARMUP_WINDOW,
+                    default=options.get(CONF_WARMUP_WINDOW, DEFAULT_WARMUP_WINDOW)
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Required(
+                    CONF_CAPTURE,
+                    default=options.get(CONF_CAPTURE, False)
+                ): bool,
+                vol.Required(
+                    CONF_TRACE,
+                    default=options.get(CONF_TRACE, False)
+                ): bool
+            })
+        )
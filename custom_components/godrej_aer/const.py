@@ -1,7 +1,34 @@
 """Constants for the Godrej Aer Smart Matic integration."""
+from .godrej.connectionpolicy import POLICY_FIXED
 
 DOMAIN = "godrej_aer"
 
-DISCONNECT_DELAY = 15
-CONNECTION_TIMEOUT = 120
-STATUS_TIMEOUT = 30  # Timeout for waiting for device status response
+MIN_POLL_INTERVAL = 60  # Shortest time between two status polls, in seconds
+MAX_POLL_INTERVAL = 3600
+WEAK_RSSI = -85  # Devices below this are polled less often
+
+CONF_ADVERTISEMENT_DEBOUNCE = "advertisement_debounce"
+DEFAULT_ADVERTISEMENT_DEBOUNCE = 5  # Seconds to collapse advertisement bursts
+
+CONF_TRIGGER_COALESCE_WINDOW = "trigger_coalesce_window"
+DEFAULT_TRIGGER_COALESCE_WINDOW = 0  # Seconds, 0 sends every trigger
+
+CONF_OFFLINE_JOURNAL = "offline_journal"
+CONF_JOURNAL_TTL = "journal_ttl"
+DEFAULT_JOURNAL_TTL = 3600  # Seconds a missed trigger stays deliverable
+
+CONF_WARMUP_WINDOW = "warmup_window"
+DEFAULT_WARMUP_WINDOW = 300  # Seconds over which first polls are spread at startup
+WARMUP_GATHER_DELAY = 2
+
+CONF_CONNECTION_POLICY = "connection_policy"
+DEFAULT_CONNECTION_POLICY = POLICY_FIXED
+CONF_IDLE_TIMEOUT = "idle_timeout"
+DEFAULT_IDLE_TIMEOUT = 15  # Seconds an idle connection is kept open
+
+CONF_CAPTURE = "capture"  # Record BLE traffic to <config>/godrej_aer/<mac>.capture
+CONF_TRACE = "trace"  # Record spans of the connection lifecycle, see godrej_aer.export_trace
+
+BATTERY_STATISTICS_MINUTE = 5  # Minute past the hour at which the last hour is imported
+BATTERY_VOLTAGE_DEADBAND = 20  # mV the battery voltage has to move before it is written
+BATTERY_LEVEL_STEP = 5  # Percent
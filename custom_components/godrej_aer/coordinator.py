@@ -0,0 +1,265 @@
+"""Polling coordinator for the Godrej Aer Smart Matic integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from homeassistant.components import bluetooth
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import (
+    DOMAIN,
+    CONF_ADVERTISEMENT_DEBOUNCE,
+    DEFAULT_ADVERTISEMENT_DEBOUNCE,
+    MIN_POLL_INTERVAL,
+    MAX_POLL_INTERVAL,
+    WEAK_RSSI
+)
+from .godrej import SmartMatic, DeviceStatus
+from .godrej.devicestatus import DEVICE_STATUS_VALIDITY_TIME
+from .godrej.events import DEVICE_REACHABILITY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SmartMaticCoordinator(DataUpdateCoordinator[DeviceStatus | None]):
+    """Polls one Smart Matic only as often as its status goes stale.
+
+    The next poll is scheduled when the current status expires. Failures
+    follow the device's retry policy and devices with a weak signal are
+    polled less often, so radio time follows the data we need rather than a fixed
+    timer.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, instance: SmartMatic):
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=f"{DOMAIN} {instance.mac}",
+            update_interval=timedelta(seconds=MIN_POLL_INTERVAL)
+        )
+        self.entry = entry
+        self.instance = instance
+        self.rssi: int | None = None
+        self.last_seen: datetime | None = None
+        self.debounce: float = entry.options.get(
+            CONF_ADVERTISEMENT_DEBOUNCE, DEFAULT_ADVERTISEMENT_DEBOUNCE
+        )
+        self._poll_task: asyncio.Task | None = None
+        self._unsub_keepalive = None
+        self._cancel_debounce = None
+        self._flush_task: asyncio.Task | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._cancel_reachability_check = None
+        self._unsub_reachability = instance.eventbus.add_listener(
+            DEVICE_REACHABILITY, lambda _reachability: self._async_schedule_reachability_check()
+        )
+
+    @property
+    def started(self) -> bool:
+        return self._unsub_keepalive is not None
+
+    @property
+    def staleness(self) -> float:
+        """Seconds since the last known status, infinite when there is none."""
+        device_status = self.instance.device_status
+        if device_status is None:
+            return float("inf")
+        return (datetime.now() - device_status.date).total_seconds()
+
+    @callback
+    def async_start(self, first_poll_in: float = MIN_POLL_INTERVAL):
+        """Start the polling timer, polling after first_poll_in seconds at the earliest."""
+        # A status restored from storage postpones the first poll further
+        device_status = self.instance.device_status
+        if device_status is not None and device_status.is_valid:
+            first_poll_in = max(first_poll_in, self._next_interval())
+        self.update_interval = timedelta(seconds=max(first_poll_in, 1))
+        # The coordinator only schedules refreshes while it has listeners
+        self._unsub_keepalive = self.async_add_listener(lambda: None)
+
+    @callback
+    def async_handle_advertisement(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange
+    ):
+        """Record an advertisement and poll at most once per debounce window.
+
+        Advertisements arriving while a poll is pending or running only
+        refresh the RSSI and last-seen time.
+        """
+        self.rssi = service_info.rssi
+        self.last_seen = datetime.now()
+
+        self.instance.process_advertisement(service_info)
+        self._async_schedule_reachability_check()
+        if service_info.connectable:
+            self._async_flush_journal()
+            self._async_keep_connected()
+        if self.instance.device_status and self.instance.device_status.is_valid:
+            return
+        if not self.started:
+            # Still waiting for its warm-up slot
+            return
+        if self._cancel_debounce is not None:
+            return
+        if not self.instance.retry_policy.allow_attempt():
+            return
+        if self._poll_task is not None and not self._poll_task.done():
+            return
+
+        self._cancel_debounce = async_call_later(
+            self.hass, self.debounce, self._async_debounce_expired
+        )
+
+    @callback
+    def _async_schedule_reachability_check(self):
+        """Check again once the device would count as gone, unless one is pending."""
+        if self._cancel_reachability_check is not None:
+            return
+        expires_in = self.instance.reachability.expires_in
+        if expires_in is None:
+            return
+        self._cancel_reachability_check = async_call_later(
+            self.hass, expires_in + 1, self._async_check_reachability
+        )
+
+    @callback
+    def _async_check_reachability(self, _now: datetime):
+        self._cancel_reachability_check = None
+        reachability = self.instance.reachability
+        # The bluetooth integration skips the callback when only the RSSI of
+        # an advertisement changed, so it may have heard the device since
+        service_info = bluetooth.async_last_service_info(
+            self.hass, self.instance.mac, connectable=False
+        )
+        if service_info is not None and (
+            reachability.last_seen is None or service_info.time > reachability.last_seen
+        ):
+            self.rssi = service_info.rssi
+            reachability.on_advertisement(service_info.rssi, seen_at=service_info.time)
+        reachability.update()
+        self._async_schedule_reachability_check()
+
+    @callback
+    def _async_flush_journal(self):
+        journal = self.instance.journal
+        if journal is None or not len(journal):
+            return
+        if not self.started:
+            # Replayed once the warm-up has started the poller
+            return
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        if not self.instance.retry_policy.allow_attempt():
+            return
+
+        _LOGGER.debug("%s is back, delivering %s journaled commands", self.instance.mac, len(journal))
+        self._flush_task = self.hass.async_create_background_task(
+            self.instance.flush_journal(),
+            f"{DOMAIN} journal flush {self.instance.mac}"
+        )
+
+    @callback
+    def _async_keep_connected(self):
+        """Reconnect a device that should stay connected but lost its link."""
+        if not self.instance.connection_policy.keep_connected or not self.started:
+            return
+        client = self.instance.client
+        if client is not None and client.is_connected:
+            return
+        if self._reconnect_task is not None and not self._reconnect_task.done():
+            return
+        if not self.instance.retry_policy.allow_attempt():
+            return
+
+        self._reconnect_task = self.hass.async_create_background_task(
+            self._async_reconnect(),
+            f"{DOMAIN} reconnect {self.instance.mac}"
+        )
+
+    async def _async_reconnect(self):
+        try:
+            await self.instance.connect()
+        except Exception as e:
+            _LOGGER.debug("Could not reconnect to %s: %s", self.instance.mac, e)
+
+    @callback
+    def _async_debounce_expired(self, _now: datetime):
+        self._cancel_debounce = None
+        if self._poll_task is not None and not self._poll_task.done():
+            return
+        self.hass.async_create_background_task(
+            self.async_refresh(),
+            f"{DOMAIN} advertisement poll {self.instance.mac}"
+        )
+
+    async def async_shutdown(self) -> None:
+        if self._cancel_debounce is not None:
+            self._cancel_debounce()
+            self._cancel_debounce = None
+        if self._cancel_reachability_check is not None:
+            self._cancel_reachability_check()
+            self._cancel_reachability_check = None
+        self._unsub_reachability()
+        if self._unsub_keepalive is not None:
+            self._unsub_keepalive()
+            self._unsub_keepalive = None
+        for task in (self._poll_task, self._flush_task, self._reconnect_task):
+            if task is not None and not task.done():
+                task.cancel()
+        await super().async_shutdown()
+
+    async def _async_update_data(self) -> DeviceStatus | None:
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = self.hass.async_create_background_task(
+                self._async_poll(),
+                f"{DOMAIN} poll {self.instance.mac}"
+            )
+        try:
+            # Concurrent refreshes share the poll already in flight
+            return await asyncio.shield(self._poll_task)
+        finally:
+            self.update_interval = timedelta(seconds=self._next_interval())
+
+    async def _async_poll(self) -> DeviceStatus | None:
+        if not bluetooth.async_address_present(
+            self.hass, self.instance.mac, connectable=True
+        ):
+            return self.instance.device_status
+
+        if not self.instance.retry_policy.allow_attempt():
+            return self.instance.device_status
+
+        try:
+            await self.instance.connect_if_needed()
+        except Exception as e:
+            raise UpdateFailed(f"Failed to poll {self.instance.mac}: {e}") from e
+
+        return self.instance.device_status
+
+    def _next_interval(self) -> float:
+        device_status = self.instance.device_status
+        if device_status is not None and device_status.is_valid:
+            expires = device_status.date + DEVICE_STATUS_VALIDITY_TIME
+            interval = (expires - datetime.now()).total_seconds()
+        else:
+            interval = MIN_POLL_INTERVAL
+
+        retry_policy = self.instance.retry_policy
+        if retry_policy.failures:
+            interval = max(interval, retry_policy.retry_in)
+
+        service_info = bluetooth.async_last_service_info(
+            self.hass, self.instance.mac, connectable=True
+        )
+        if service_info is not None and service_info.rssi < WEAK_RSSI:
+            interval *= 2
+
+        return max(MIN_POLL_INTERVAL, min(interval, MAX_POLL_INTERVAL))
@@ -0,0 +1,69 @@
+"""Diagnostics support for the Godrej Aer Smart Matic integration."""
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_MAC
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import SmartMaticCoordinator
+from .godrej import SmartMatic
+
+TO_REDACT = {CONF_MAC}
+REDACTED = "**REDACTED**"
+
+
+def _redact_address(data: Any, mac: str) -> Any:
+    """Replace the device address inside strings, such as error messages."""
+    pattern = re.compile(re.escape(mac), re.IGNORECASE)
+    if isinstance(data, str):
+        return pattern.sub(REDACTED, data)
+    if isinstance(data, dict):
+        return {key: _redact_address(value, mac) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_redact_address(value, mac) for value in data]
+    return data
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    instance: SmartMatic = entry.runtime_data
+    coordinator: SmartMaticCoordinator = hass.data[DOMAIN][entry.entry_id]
+    device_status = instance.device_status
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT)
+        },
+        "connected": bool(instance.client and instance.client.is_connected),
+        "mtu": instance.mtu,
+        "device_status": {
+            "date": device_status.date.isoformat(),
+            "battery_mv": device_status.battery_mv,
+            "fields": {key: repr(value) for key, value in device_status.fields.items()}
+        } if device_status else None,
+        "coordinator": {
+            "update_interval": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval else None,
+            "rssi": coordinator.rssi,
+            "last_seen": coordinator.last_seen.isoformat() if coordinator.last_seen else None
+        },
+        "link": _redact_address(instance.retry_policy.as_dict(), instance.mac),
+        "reachability": instance.reachability.as_dict(),
+        "battery": instance.battery.as_dict(),
+        "routes": _redact_address(instance.router.as_dict(), instance.mac),
+        "connection_policy": instance.connection_policy.as_dict(),
+        "metrics": instance.metrics.as_dict(),
+        "commands": _redact_address(
+            [result.as_dict() for result in instance.commands.results], instance.mac
+        ),
+        "scheduler": instance.scheduler.usage(),
+        "trace": instance.tracer.summary() if instance.tracer is not None else None
+    }
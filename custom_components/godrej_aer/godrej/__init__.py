@@ -1,4 +1,13 @@
 from .godrej import SmartMatic
 from .devicestatus import DeviceStatus
+from .eventbus import EventBus
+from .resolver import DeviceResolver, ScannerResolver, StaticResolver
 
-__all__ = ["SmartMatic", "DeviceStatus"]
\ No newline at end of file
+__all__ = [
+    "SmartMatic",
+    "DeviceStatus",
+    "EventBus",
+    "DeviceResolver",
+    "ScannerResolver",
+    "StaticResolver"
+]
\ No newline at end of file
@@ -0,0 +1,29 @@
+from .devicestatus import DeviceStatus, STATUS_FRAME_LENGTH
+from .const import MAIN_SVC
+
+
+def _candidate_payloads(service_info):
+    service_data = getattr(service_info, "service_data", None) or {}
+    for uuid, payload in service_data.items():
+        if uuid.lower() == MAIN_SVC:
+            yield payload
+
+    manufacturer_data = getattr(service_info, "manufacturer_data", None) or {}
+    for payload in manufacturer_data.values():
+        yield payload
+
+
+def parse_advertisement(service_info) -> DeviceStatus | None:
+    """Build a DeviceStatus from advertisement data, if the firmware put one there.
+
+    Returns None when the advertisement does not carry a status frame, in
+    which case the status has to be read over a GATT connection.
+    """
+    for payload in _candidate_payloads(service_info):
+        if len(payload) == STATUS_FRAME_LENGTH:
+            device_status = DeviceStatus(bytes(payload))
+            # Any 99 byte payload gets a battery_mv from the fixed offset,
+            # only a decoded CBOR status map is really one
+            if device_status.fields:
+                return device_status
+    return None
@@ -0,0 +1,106 @@
+import logging
+import random
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+STATES = [STATE_CLOSED, STATE_OPEN, STATE_HALF_OPEN]
+
+BASE_DELAY = 5.0
+MAX_DELAY = 900.0
+FAILURE_THRESHOLD = 5
+JITTER = 0.3
+STRONG_RSSI = -80
+
+
+class RetryPolicy:
+    """Jittered exponential backoff with a circuit breaker for one device.
+
+    Each failure pushes the next allowed attempt further out. After
+    ``failure_threshold`` consecutive failures the circuit opens and no
+    attempts are made until an advertisement shows the device is back
+    (strong RSSI, or any RSSI once ``max_delay`` has passed). The circuit
+    is then half-open: one attempt is let through, which either closes the
+    circuit again or re-opens it.
+    """
+
+    def __init__(
+        self,
+        base_delay: float = BASE_DELAY,
+        max_delay: float = MAX_DELAY,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        jitter: float = JITTER,
+        strong_rssi: int = STRONG_RSSI,
+        on_state_change=None,
+        clock=time.monotonic
+    ):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.jitter = jitter
+        self.strong_rssi = strong_rssi
+        self.on_state_change = on_state_change
+        self._clock = clock
+
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.last_error: str | None = None
+        self._next_attempt = 0.0
+        self._opened_at = 0.0
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the next attempt is allowed, ignoring the circuit."""
+        return max(0.0, self._next_attempt - self._clock())
+
+    def allow_attempt(self) -> bool:
+        if self.state == STATE_OPEN:
+            return False
+        if self.state == STATE_HALF_OPEN:
+            return True
+        return self.retry_in == 0
+
+    def record_success(self):
+        self.failures = 0
+        self.last_error = None
+        self._next_attempt = 0.0
+        self._set_state(STATE_CLOSED)
+
+    def record_failure(self, error: Exception | str | None = None):
+        self.failures += 1
+        self.last_error = str(error) if error is not None else None
+
+        delay = min(self.max_delay, self.base_delay * 2 ** (self.failures - 1))
+        delay *= 1 + self.jitter * (2 * random.random() - 1)
+        self._next_attempt = self._clock() + delay
+
+        if self.state == STATE_HALF_OPEN or self.failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+            self._set_state(STATE_OPEN)
+
+    def on_advertisement(self, rssi: int | None):
+        """Half-open the circuit when the device shows up with a usable link."""
+        if self.state != STATE_OPEN or rssi is None:
+            return
+        if rssi >= self.strong_rssi or \
+                self._clock() - self._opened_at >= self.max_delay:
+            self._set_state(STATE_HALF_OPEN)
+
+    def as_dict(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "retry_in": round(self.retry_in, 1),
+            "last_error": self.last_error
+        }
+
+    def _set_state(self, state: str):
+        if state == self.state:
+            return
+        _LOGGER.debug("Circuit %s -> %s after %s failures", self.state, state, self.failures)
+        self.state = state
+        if self.on_state_change is not None:
+            self.on_state_change(self)
@@ -0,0 +1,116 @@
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+SAMPLES = 1008  # A week of samples at one per ten minutes
+MIN_SAMPLE_INTERVAL = timedelta(minutes=10)
+ETA_WINDOW = timedelta(days=7)
+MIN_ETA_SPAN = timedelta(days=2)
+
+# Open circuit voltage of two alkaline AA cells against remaining capacity.
+# An estimate, the device does not report a level of its own.
+DISCHARGE_CURVE = [
+    (3200, 100),
+    (3000, 85),
+    (2850, 65),
+    (2700, 40),
+    (2550, 20),
+    (2400, 8),
+    (2200, 0)
+]
+EMPTY_MV = DISCHARGE_CURVE[-1][0]
+
+
+def battery_level(battery_mv: int) -> int:
+    """Remaining capacity in percent, interpolated along DISCHARGE_CURVE."""
+    if battery_mv >= DISCHARGE_CURVE[0][0]:
+        return 100
+    for (high_mv, high), (low_mv, low) in zip(DISCHARGE_CURVE, DISCHARGE_CURVE[1:]):
+        if battery_mv >= low_mv:
+            return round(low + (battery_mv - low_mv) * (high - low) / (high_mv - low_mv))
+    return 0
+
+
+class BatteryHistory:
+    """Recent battery voltage samples of one device.
+
+    Statuses arrive from polls and advertisements alike, so samples closer
+    than ``min_interval`` to the previous one replace it rather than being
+    added. Dates are timezone aware, hours are UTC hours.
+    """
+
+    def __init__(self, size: int = SAMPLES, min_interval: timedelta = MIN_SAMPLE_INTERVAL):
+        self.min_interval = min_interval
+        self._samples: deque[tuple[datetime, int]] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, date: datetime, battery_mv: int):
+        date = date.astimezone(timezone.utc)
+        if self._samples:
+            last_date, _ = self._samples[-1]
+            if date < last_date:
+                return
+            if date - last_date < self.min_interval:
+                self._samples[-1] = (last_date, battery_mv)
+                return
+        self._samples.append((date, battery_mv))
+
+    def hourly(self, since: datetime | None = None, until: datetime | None = None) -> list[dict]:
+        """min/mean/max per hour, for the complete hours in [since, until)."""
+        buckets: dict[datetime, list[int]] = {}
+        for date, battery_mv in self._samples:
+            if since is not None and date < since:
+                continue
+            if until is not None and date >= until:
+                continue
+            hour = date.replace(minute=0, second=0, microsecond=0)
+            buckets.setdefault(hour, []).append(battery_mv)
+        return [
+            {
+                "start": hour,
+                "min": min(values),
+                "mean": sum(values) / len(values),
+                "max": max(values)
+            }
+            for hour, values in sorted(buckets.items())
+        ]
+
+    def depletion_eta(self, now: datetime | None = None) -> timedelta | None:
+        """Time until EMPTY_MV at the recent rate of discharge.
+
+        A least-squares line through the samples of the last ETA_WINDOW.
+        None while there is too little history or the voltage is not
+        dropping.
+        """
+        now = now or datetime.now(timezone.utc)
+        samples = [
+            sample for sample in self._samples
+            if now - sample[0] <= ETA_WINDOW
+        ]
+        if len(samples) < 3 or samples[-1][0] - samples[0][0] < MIN_ETA_SPAN:
+            return None
+
+        origin = samples[0][0]
+        xs = [(date - origin).total_seconds() for date, _ in samples]
+        ys = [battery_mv for _, battery_mv in samples]
+        mean_x = sum(xs) / len(xs)
+        mean_y = sum(ys) / len(ys)
+        variance = sum((x - mean_x) ** 2 for x in xs)
+        slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+        if slope >= 0:
+            return None
+
+        current = mean_y + slope * ((now - origin).total_seconds() - mean_x)
+        if current <= EMPTY_MV:
+            return timedelta(0)
+        return timedelta(seconds=(current - EMPTY_MV) / -slope)
+
+    def as_dict(self) -> dict:
+        eta = self.depletion_eta()
+        return {
+            "samples": len(self._samples),
+            "first": self._samples[0][0].isoformat() if self._samples else None,
+            "level": battery_level(self._samples[-1][1]) if self._samples else None,
+            "depletion_eta_days": round(eta / timedelta(days=1), 1) if eta is not None else None
+        }
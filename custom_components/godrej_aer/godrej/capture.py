@@ -0,0 +1,194 @@
+"""Recording a device's BLE traffic, and replaying it without the device.
+
+A capture is a text file, one record per line::
+
+    # godrej-capture 1 AA:BB:CC:DD:EE:FF 2026-01-01T12:00:00+00:00
+    0.000 C proxy-kitchen
+    0.412 W bf626d54186b626d4e189dff
+    0.466 N bf626d54186c626d4e189d...
+
+The first column is seconds since the capture started, the second the
+direction: W is a write to WRITE_CHAR, N a notification from NOTIFY_CHAR,
+C a connection (with the proxy) and D a disconnection.
+"""
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterator
+
+from .const import NOTIFY_CHAR
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTURE_VERSION = 1
+HEADER_PREFIX = "# godrej-capture"
+
+WRITE = "W"
+NOTIFY = "N"
+CONNECT = "C"
+DISCONNECT = "D"
+
+FLUSH_RECORDS = 64
+FLUSH_INTERVAL = 5.0  # Seconds a record waits in the buffer at most
+MAX_CAPTURE_BYTES = 5 * 1024 * 1024  # Rotated to <path>.1 beyond this
+
+# A single thread, so buffers reach the file in the order they were flushed
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="godrej_capture")
+
+
+@dataclass
+class CaptureRecord:
+    time: float
+    direction: str
+    data: bytes = b""
+    note: str | None = None
+
+
+class CaptureWriter:
+    """Buffers records and appends them to the capture file off the event loop.
+
+    The buffer is written out once it holds FLUSH_RECORDS records, on every
+    connection and disconnection, and at the latest FLUSH_INTERVAL seconds
+    after a record was added, so a crash loses little of the capture.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mac: str,
+        max_bytes: int = MAX_CAPTURE_BYTES,
+        clock=time.monotonic
+    ):
+        self.path = path
+        self.mac = mac
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._started = clock()
+        self._lines: list[str] = [self._header()]
+        self._pending: asyncio.Future | None = None
+        self._flush_timer: asyncio.TimerHandle | None = None
+
+    def _header(self) -> str:
+        started = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        return f"{HEADER_PREFIX} {CAPTURE_VERSION} {self.mac} {started}\n"
+
+    def record(self, direction: str, data: bytes = b"", note: str | None = None):
+        payload = note if note is not None else bytes(data).hex()
+        self._lines.append(f"{self._clock() - self._started:.3f} {direction} {payload}\n")
+        if direction in (CONNECT, DISCONNECT) or len(self._lines) >= FLUSH_RECORDS:
+            self.flush()
+        elif self._flush_timer is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self._flush_timer = loop.call_later(FLUSH_INTERVAL, self.flush)
+
+    def flush(self):
+        """Hand the buffered records to an executor thread."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._lines:
+            return
+        lines, self._lines = self._lines, []
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._append(lines)
+            return
+        self._pending = loop.run_in_executor(_EXECUTOR, self._append, lines)
+
+    async def close(self):
+        self.flush()
+        if self._pending is not None:
+            await self._pending
+
+    def _append(self, lines: list[str]):
+        try:
+            if os.path.exists(self.path) and os.path.getsize(self.path) > self.max_bytes:
+                os.replace(self.path, f"{self.path}.1")
+                if not lines[0].startswith(HEADER_PREFIX):
+                    lines = [self._header(), *lines]
+            with open(self.path, "a", encoding="ascii") as capture:
+                capture.writelines(lines)
+        except OSError as e:
+            _LOGGER.warning("Could not write BLE capture %s: %s", self.path, e)
+
+
+def read_capture(path: str) -> Iterator[CaptureRecord]:
+    """The records of a capture file, header lines are skipped."""
+    with open(path, encoding="ascii") as capture:
+        for line in capture:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            offset, direction, *rest = line.split(" ", 2)
+            payload = rest[0] if rest else ""
+            if direction in (WRITE, NOTIFY):
+                yield CaptureRecord(float(offset), direction, bytes.fromhex(payload))
+            else:
+                yield CaptureRecord(float(offset), direction, note=payload or None)
+
+
+class _ReplayedCharacteristic:
+    uuid = NOTIFY_CHAR
+
+
+@dataclass
+class ReplayStats:
+    records: int = 0
+    writes: int = 0
+    notifications: int = 0
+    connections: int = 0
+    statuses: int = 0
+    handler_seconds: float = 0.0
+
+
+async def replay(smartmatic, records, speed: float | None = None) -> ReplayStats:
+    """Feed captured traffic through a SmartMatic's notification handling.
+
+    Notifications go through the reassembler and DeviceStatus decoding
+    exactly as they would from a live link, disconnections reset it.
+    ``speed`` 1.0 keeps the captured timing, None replays as fast as
+    possible.
+    """
+    stats = ReplayStats()
+    sender = _ReplayedCharacteristic()
+    statuses = 0
+
+    def _count(_status):
+        nonlocal statuses
+        statuses += 1
+
+    previous_callback = smartmatic.on_device_status
+    smartmatic.on_device_status = _count
+    started = time.monotonic()
+    try:
+        for record in records:
+            stats.records += 1
+            if speed:
+                delay = record.time / speed - (time.monotonic() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            if record.direction == NOTIFY:
+                stats.notifications += 1
+                handler_started = time.perf_counter()
+                await smartmatic._notification_handler(sender, bytearray(record.data))
+                stats.handler_seconds += time.perf_counter() - handler_started
+            elif record.direction == WRITE:
+                stats.writes += 1
+            elif record.direction == CONNECT:
+                stats.connections += 1
+                smartmatic._reassembler.reset()
+            elif record.direction == DISCONNECT:
+                smartmatic._reassembler.reset()
+    finally:
+        smartmatic.on_device_status = previous_callback
+    stats.statuses = statuses
+    return stats
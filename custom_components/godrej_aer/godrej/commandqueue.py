@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+RESULT_HISTORY = 32
+
+
+@dataclass
+class CommandResult:
+    command: str
+    queued_at: float = field(default_factory=time.monotonic)
+    started_at: float | None = None
+    finished_at: float | None = None
+    coalesced: bool = False
+    deferred: bool = False
+    error: str | None = None
+    reply: bytes | None = None  # What the executor returned, for raw commands
+
+    @property
+    def wait_time(self) -> float | None:
+        if self.started_at is None:
+            return None
+        return self.started_at - self.queued_at
+
+    @property
+    def latency(self) -> float | None:
+        """Seconds from submitting the command until it completed."""
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.queued_at
+
+    def as_dict(self) -> dict:
+        return {
+            "command": self.command,
+            "wait_time": self.wait_time,
+            "latency": self.latency,
+            "coalesced": self.coalesced,
+            "deferred": self.deferred,
+            "error": self.error
+        }
+
+
+class _PendingCommand:
+    __slots__ = ("name", "args", "result", "future")
+
+    def __init__(self, name: str, args: tuple = ()):
+        self.name = name
+        self.args = args
+        self.result = CommandResult(name)
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        # The submitter may have gone away, don't warn about unread errors
+        self.future.add_done_callback(
+            lambda future: future.cancelled() or future.exception()
+        )
+
+
+class CommandQueue:
+    """Runs the commands of one device strictly one after the other.
+
+    A coalescable command submitted while an identical one is still queued,
+    or within ``coalesce_window`` seconds of one finishing successfully,
+    shares that command's result instead of being sent again.
+    """
+
+    def __init__(
+        self,
+        executor: Callable[..., Awaitable[bytes | None]],
+        on_idle: Callable[[], Awaitable[None]] | None = None,
+        coalesce_window: float = 0.0
+    ):
+        self._executor = executor
+        self._on_idle = on_idle
+        self.coalesce_window = coalesce_window
+        self._queue: deque[_PendingCommand] = deque()
+        self._worker: asyncio.Task | None = None
+        self._last_finished: dict[str, CommandResult] = {}
+        self.results: deque[CommandResult] = deque(maxlen=RESULT_HISTORY)
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    async def submit(self, name: str, *args, coalesce: bool = False) -> CommandResult:
+        """Queue a command and wait for it to complete.
+
+        ``args`` are passed on to the executor. Raises whatever the command
+        raised.
+        """
+        if coalesce:
+            coalesced = self._coalesce(name)
+            if coalesced is not None:
+                return await coalesced
+
+        command = _PendingCommand(name, args)
+        self._queue.append(command)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+        return await asyncio.shield(command.future)
+
+    def _coalesce(self, name: str) -> Awaitable[CommandResult] | None:
+        for command in self._queue:
+            if command.name == name:
+                _LOGGER.debug("Coalescing %s with the queued one", name)
+                return self._share(command.future, name)
+
+        last = self._last_finished.get(name)
+        if last is not None and self.coalesce_window > 0 and \
+                time.monotonic() - last.finished_at < self.coalesce_window:
+            _LOGGER.debug("Coalescing %s with the one sent %.1fs ago",
+                          name, time.monotonic() - last.finished_at)
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(last)
+            return self._share(future, name)
+        return None
+
+    async def _share(self, future: asyncio.Future, name: str) -> CommandResult:
+        queued_at = time.monotonic()
+        original: CommandResult = await asyncio.shield(future)
+        result = CommandResult(
+            name,
+            queued_at=queued_at,
+            started_at=original.started_at,
+            finished_at=max(time.monotonic(), queued_at),
+            coalesced=True
+        )
+        self.results.append(result)
+        return result
+
+    async def _run(self):
+        while self._queue:
+            command = self._queue[0]
+            result = command.result
+            result.started_at = time.monotonic()
+            try:
+                result.reply = await self._executor(command.name, *command.args)
+            except Exception as e:
+                result.error = str(e) or type(e).__name__
+                if not command.future.done():
+                    command.future.set_exception(e)
+            else:
+                if not command.future.done():
+                    command.future.set_result(result)
+                self._last_finished[command.name] = result
+            finally:
+                result.finished_at = time.monotonic()
+                if self._queue:
+                    self._queue.popleft()
+                self.results.append(result)
+
+        if self._on_idle is not None:
+            try:
+                await self._on_idle()
+            except Exception as e:
+                _LOGGER.debug("Idle handler failed: %s", e)
+
+    def cancel(self):
+        """Cancel everything still queued and stop the worker."""
+        for command in self._queue:
+            if not command.future.done():
+                command.future.cancel()
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+        self._queue.clear()
@@ -0,0 +1,81 @@
+import time
+from collections import deque
+
+from .const import DISCONNECT_DELAY
+
+POLICY_ALWAYS = "always"
+POLICY_FIXED = "fixed"
+POLICY_ADAPTIVE = "adaptive"
+POLICIES = [POLICY_FIXED, POLICY_ADAPTIVE, POLICY_ALWAYS]
+
+INTERVAL_SAMPLES = 50
+MIN_INTERVAL_SAMPLES = 5
+ADAPTIVE_PERCENTILE = 80
+ADAPTIVE_MARGIN = 1.25
+MAX_ADAPTIVE_IDLE = 900  # Seconds, commands further apart than this reconnect
+
+
+class ConnectionPolicy:
+    """Decides how long an idle connection is kept open.
+
+    ``always`` never disconnects, ``fixed`` disconnects ``idle_timeout``
+    seconds after the last command. ``adaptive`` learns how far apart
+    commands usually are: when most of them arrive within
+    ``MAX_ADAPTIVE_IDLE`` the link is kept long enough to catch the next
+    one, otherwise it is dropped after ``idle_timeout`` like ``fixed``.
+
+    Whatever the policy, an idle connection gives its proxy slot up as
+    soon as another device is waiting for it.
+    """
+
+    def __init__(
+        self,
+        policy: str = POLICY_FIXED,
+        idle_timeout: float = DISCONNECT_DELAY,
+        max_idle: float = MAX_ADAPTIVE_IDLE,
+        clock=time.monotonic
+    ):
+        self.policy = policy
+        self.idle_timeout = idle_timeout
+        self.max_idle = max_idle
+        self._clock = clock
+        self._intervals: deque[float] = deque(maxlen=INTERVAL_SAMPLES)
+        self._last_command: float | None = None
+
+    @property
+    def keep_connected(self) -> bool:
+        return self.policy == POLICY_ALWAYS
+
+    def record_command(self):
+        now = self._clock()
+        if self._last_command is not None:
+            self._intervals.append(now - self._last_command)
+        self._last_command = now
+
+    def learned_timeout(self) -> float | None:
+        """The adaptive idle time, None until enough commands were seen."""
+        if len(self._intervals) < MIN_INTERVAL_SAMPLES:
+            return None
+        ordered = sorted(self._intervals)
+        index = min(len(ordered) - 1, int(ADAPTIVE_PERCENTILE / 100 * len(ordered)))
+        interval = ordered[index] * ADAPTIVE_MARGIN
+        if interval > self.max_idle:
+            return None
+        return max(self.idle_timeout, interval)
+
+    def idle_time(self) -> float | None:
+        """Seconds to stay connected after a command, None for forever."""
+        if self.policy == POLICY_ALWAYS:
+            return None
+        if self.policy == POLICY_ADAPTIVE:
+            return self.learned_timeout() or self.idle_timeout
+        return self.idle_timeout
+
+    def as_dict(self) -> dict:
+        return {
+            "policy": self.policy,
+            "idle_timeout": self.idle_timeout,
+            "idle_time": self.idle_time(),
+            "learned_timeout": self.learned_timeout(),
+            "command_intervals": len(self._intervals)
+        }
@@ -0,0 +1,10 @@
+DISCONNECT_DELAY = 15
+CONNECTION_TIMEOUT = 120
+STATUS_TIMEOUT = 30  # Timeout for waiting for device status response
+
+MAIN_SVC    = "6e400000-b5a3-f393-e0a9-e50e24dcca9e"
+NOTIFY_CHAR = "6e400001-b5a3-f393-e0a9-e50e24dcca9e"
+WRITE_CHAR  = "6e400002-b5a3-f393-e0a9-e50e24dcca9e"
+
+DEFAULT_MTU = 23
+ATT_HEADER_SIZE = 3
@@ -1,20 +1,54 @@
-import struct
 from datetime import datetime, timedelta
+from typing import Any
+
+from .protocol import CBORDecoder, CBORDecodeError
 
 DEVICE_STATUS_VALIDITY_TIME = timedelta(minutes=60)
+STATUS_FRAME_LENGTH = 99
+
+# The battery voltage is the uint32 whose CBOR header sits at this offset
+BATTERY_VALUE_OFFSET = 20
+
 
 class DeviceStatus:
-    battery_mv: int | None = None
+    __slots__ = ("date", "raw", "fields", "battery_mv")
+
+    def __init__(self, status_bytes: bytes, date: datetime | None = None):
+        self.date = date or datetime.now()
+        self.raw = bytes(status_bytes)
+        self.fields: dict[str, Any] = {}
+        self.battery_mv: int | None = None
+        if len(self.raw) == STATUS_FRAME_LENGTH:
+            self._parse(memoryview(self.raw))
+
+    def _parse(self, view: memoryview):
+        try:
+            for key, value, offset in CBORDecoder(view).iter_map():
+                self.fields[key] = value
+                if offset == BATTERY_VALUE_OFFSET and isinstance(value, int):
+                    self.battery_mv = value
+        except CBORDecodeError:
+            pass
 
-    def __init__(self, status_bytes: bytes):
-        self.date = datetime.now()
-        if len(status_bytes) == 99:
-            self.battery_mv = struct.unpack(
-                ">I",
-                status_bytes[21:25]
-            )[0]
+        if self.battery_mv is None:
+            self.battery_mv = int.from_bytes(
+                view[BATTERY_VALUE_OFFSET + 1:BATTERY_VALUE_OFFSET + 5], "big"
+            )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DeviceStatus":
+        return cls(bytes.fromhex(data["raw"]), datetime.fromisoformat(data["date"]))
+
+    def as_dict(self) -> dict:
+        return {"raw": self.raw.hex(), "date": self.date.isoformat()}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.fields.get(key, default)
 
     @property
     def is_valid(self):
         return self.battery_mv is not None and \
             datetime.now() < self.date + DEVICE_STATUS_VALIDITY_TIME
+
+    def __repr__(self):
+        return f"<DeviceStatus {self.date.isoformat()} battery_mv={self.battery_mv} fields={self.fields}>"
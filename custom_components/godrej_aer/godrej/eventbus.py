@@ -1,21 +1,76 @@
 import asyncio
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
 
 class EventBus:
-  def __init__(self):
+  """Dispatches device events to listeners.
+
+  Plain functions are called synchronously, coroutine functions get a task
+  that the bus keeps track of until it finishes. Events listed in
+  ``coalesce`` are delivered once per event loop iteration, with the
+  latest data only.
+  """
+
+  def __init__(self, coalesce=()):
     self.listeners = {}
+    self.coalesce = set(coalesce)
+    self._tasks = set()
+    self._pending = {}
+    self._closed = False
 
   def add_listener(self, event_name, listener):
-    if not self.listeners.get(event_name, None):
-      self.listeners[event_name] = {listener}
-    else:
-      self.listeners[event_name].add(listener)
+    """Register a listener, returns a function that removes it again."""
+    self.listeners.setdefault(event_name, set()).add(listener)
+
+    def remove():
+      self.remove_listener(event_name, listener)
+    return remove
 
   def remove_listener(self, event_name, listener):
-    self.listeners[event_name].remove(listener)
-    if len(self.listeners[event_name]) == 0:
+    listeners = self.listeners.get(event_name)
+    if not listeners or listener not in listeners:
+      return
+    listeners.remove(listener)
+    if len(listeners) == 0:
       del self.listeners[event_name]
 
   def send(self, event_name, event_data=None):
-    listeners = self.listeners.get(event_name, [])
-    for listener in listeners:
-      asyncio.create_task(listener(event_data))
\ No newline at end of file
+    if self._closed or event_name not in self.listeners:
+      return
+
+    if event_name in self.coalesce:
+      first = event_name not in self._pending
+      self._pending[event_name] = event_data
+      if first:
+        asyncio.get_running_loop().call_soon(self._flush, event_name)
+      return
+
+    self._dispatch(event_name, event_data)
+
+  def _flush(self, event_name):
+    if event_name in self._pending:
+      self._dispatch(event_name, self._pending.pop(event_name))
+
+  def _dispatch(self, event_name, event_data):
+    for listener in list(self.listeners.get(event_name, ())):
+      if asyncio.iscoroutinefunction(listener):
+        task = asyncio.get_running_loop().create_task(listener(event_data))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        continue
+
+      try:
+        listener(event_data)
+      except Exception:
+        _LOGGER.exception("Error in %s listener %s", event_name, listener)
+
+  def close(self):
+    """Drop all listeners and cancel the tasks still running."""
+    self._closed = True
+    self.listeners.clear()
+    self._pending.clear()
+    for task in self._tasks:
+      task.cancel()
+    self._tasks.clear()
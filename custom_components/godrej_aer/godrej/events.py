@@ -1,3 +1,5 @@
 DEVICE_CONNECT = "smartmatic_device_connected"
 DEVICE_DISCONNECT = "smartmatic_device_disconnected"
 DEVICE_STATUS_UPDATE = "smartmatic_device_status_update"
+DEVICE_LINK_STATE = "smartmatic_device_link_state"
+DEVICE_REACHABILITY = "smartmatic_device_reachability"
@@ -1,11 +1,17 @@
-from homeassistant.exceptions import HomeAssistantError
+class SmartMaticError(Exception):
+    """Base class of the errors raised by the godrej package."""
 
+class InvalidDeviceError(SmartMaticError):
+    pass
+
+class NotConnectedError(SmartMaticError):
+    pass
 
-class InvalidDeviceError(HomeAssistantError):
+class ConnectionError(SmartMaticError):
     pass
 
-class NotConnectedError(HomeAssistantError):
+class BackingOffError(ConnectionError):
     pass
 
-class ConnectionError(HomeAssistantError):
-    pass
\ No newline at end of file
+class UnconfirmedCommandError(SmartMaticError):
+    """The command was sent, but the device never confirmed it."""
@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from itertools import zip_longest
+
+from .godrej import SmartMatic
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_PARALLEL = 8
+
+
+@dataclass
+class FleetTriggerResult:
+    mac: str
+    success: bool
+    reused_connection: bool
+    source: str | None = None
+    started_at: float | None = None
+    latency: float | None = None
+    deferred: bool = False
+    error: str | None = None
+
+    def as_dict(self) -> dict:
+        return {
+            "mac": self.mac,
+            "success": self.success,
+            "reused_connection": self.reused_connection,
+            "source": self.source,
+            "started_at": round(self.started_at, 3) if self.started_at is not None else None,
+            "latency": round(self.latency, 3) if self.latency is not None else None,
+            "deferred": self.deferred,
+            "error": self.error
+        }
+
+
+def _connected(smartmatic: SmartMatic) -> bool:
+    return bool(smartmatic.client and smartmatic.client.is_connected)
+
+
+def plan(smartmatics: list[SmartMatic]) -> list[SmartMatic]:
+    """Order devices so that the proxies are kept busy in parallel.
+
+    Devices that are already connected go first, they need no slot. The
+    rest are grouped by the proxy they will most likely connect through
+    and interleaved, so each proxy starts on its own devices right away
+    instead of one proxy's devices queueing up in front of everyone else.
+    """
+    connected = [smartmatic for smartmatic in smartmatics if _connected(smartmatic)]
+    by_source: dict[str | None, list[SmartMatic]] = {}
+    for smartmatic in smartmatics:
+        if _connected(smartmatic):
+            continue
+        routes = smartmatic.router.rank(
+            smartmatic.resolver.routes(smartmatic.mac),
+            smartmatic.scheduler.free_slots()
+        )
+        source = routes[0].source if routes else None
+        by_source.setdefault(source, []).append(smartmatic)
+
+    interleaved = [
+        smartmatic
+        for batch in zip_longest(*by_source.values())
+        for smartmatic in batch
+        if smartmatic is not None
+    ]
+    return connected + interleaved
+
+
+async def trigger_all(
+    smartmatics: list[SmartMatic],
+    max_parallel: int = DEFAULT_MAX_PARALLEL,
+    read_status: bool = False
+) -> list[FleetTriggerResult]:
+    """Trigger every device, at most ``max_parallel`` at a time.
+
+    Connection slots per proxy are still enforced by each device's
+    ConnectionScheduler. Results come back in the order of ``smartmatics``.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_parallel))
+    started = time.monotonic()
+
+    async def _trigger(smartmatic: SmartMatic) -> FleetTriggerResult:
+        async with semaphore:
+            result = FleetTriggerResult(
+                smartmatic.mac,
+                success=False,
+                reused_connection=_connected(smartmatic),
+                started_at=time.monotonic() - started
+            )
+            try:
+                command = await smartmatic.trigger(read_status=read_status)
+            except Exception as e:
+                _LOGGER.debug("Group trigger of %s failed: %s", smartmatic.mac, e)
+                result.error = str(e) or type(e).__name__
+            else:
+                result.success = not command.deferred
+                result.deferred = command.deferred
+                result.error = command.error
+            result.latency = time.monotonic() - started - result.started_at
+            result.source = smartmatic.source
+            return result
+
+    ordered = plan(smartmatics)
+    results = await asyncio.gather(*[_trigger(smartmatic) for smartmatic in ordered])
+    by_mac = {result.mac: result for result in results}
+    return [by_mac[smartmatic.mac] for smartmatic in smartmatics]
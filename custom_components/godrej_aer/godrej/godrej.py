@@ -1,103 +1,298 @@
 import asyncio
 import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Callable
 from bleak import BleakClient, BleakError
-
-from homeassistant.components.bluetooth import (
-    async_ble_device_from_address
+from bleak.backends.characteristic import BleakGATTCharacteristic
+from bleak_retry_connector import (
+    BleakClientWithServiceCache,
+    establish_connection
 )
 
-from ..const import (
-    DISCONNECT_DELAY,
-    CONNECTION_TIMEOUT,
-    STATUS_TIMEOUT
+from . import protocol
+from .advertisement import parse_advertisement
+from .const import (
+    ATT_HEADER_SIZE,
+    DEFAULT_MTU,
+    STATUS_TIMEOUT,
+    MAIN_SVC,
+    NOTIFY_CHAR,
+    WRITE_CHAR
 )
+from .backoff import RetryPolicy, STATE_OPEN
+from .battery import BatteryHistory
+from . import capture
+from .commandqueue import CommandQueue, CommandResult
+from .connectionpolicy import ConnectionPolicy
 from .eventbus import EventBus
-from .devicestatus import DeviceStatus
+from .journal import CommandJournal
+from .metrics import DeviceMetrics
+from .reachability import Reachability
+from .reassembler import FrameReassembler
+from .resolver import DeviceResolver, Route
+from .routing import ProxyRouter
+from .scheduler import ConnectionScheduler
+from .tracing import NO_SPAN, Tracer
+from .devicestatus import DeviceStatus, STATUS_FRAME_LENGTH
 from .exception import (
+    BackingOffError,
     InvalidDeviceError,
     NotConnectedError,
-    ConnectionError
+    ConnectionError,
+    UnconfirmedCommandError
 )
 from .events import (
     DEVICE_CONNECT,
     DEVICE_DISCONNECT,
+    DEVICE_LINK_STATE,
+    DEVICE_REACHABILITY,
     DEVICE_STATUS_UPDATE
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-MAIN_SVC    = "6e400000-b5a3-f393-e0a9-e50e24dcca9e"
-NOTIFY_CHAR = "6e400001-b5a3-f393-e0a9-e50e24dcca9e"
-WRITE_CHAR  = "6e400002-b5a3-f393-e0a9-e50e24dcca9e"
+COMMAND_STATUS = "status"
+COMMAND_TRIGGER = "trigger"
+COMMAND_TRIGGER_AND_STATUS = "trigger_and_status"
+COMMAND_RAW = "raw"
 
 
 class SmartMatic:
     client: BleakClient | None = None
     device_status: DeviceStatus | None = None
-    eventbus: EventBus = EventBus()
-
-    _connect_lock = asyncio.Lock()
-    _device_status_event = asyncio.Event()
-    _disconnect_task: asyncio.Task = None
 
-    def __init__(self, hass, mac):
-        self.hass = hass
+    def __init__(
+        self,
+        resolver: DeviceResolver,
+        mac: str,
+        scheduler: ConnectionScheduler | None = None
+    ):
+        self.resolver = resolver
         self.mac = mac
+        self.scheduler = scheduler or ConnectionScheduler()
+        self.status_timeout = STATUS_TIMEOUT
+        self.mtu = DEFAULT_MTU
+        # Skip the ATT write response where the characteristic allows it
+        self.write_without_response = True
+        self.connection_policy = ConnectionPolicy()
+        self.eventbus = EventBus(coalesce=(DEVICE_STATUS_UPDATE,))
+
+        self._connect_lock = asyncio.Lock()
+        self._device_status_event = asyncio.Event()
+        self._reply: asyncio.Future | None = None
+        self._disconnect_task: asyncio.Task | None = None
+        self._slot_source: str | None = None
+        self.source: str | None = None  # Proxy of the last connection
+        self._slot_held = False
+        self._notify_char: BleakGATTCharacteristic | None = None
+        self._write_char: BleakGATTCharacteristic | None = None
+        self._reassembler = FrameReassembler()
+        self._gatt_lock = asyncio.Lock()
+        self.journal: CommandJournal | None = None
+        self.capture: capture.CaptureWriter | None = None
+        self.metrics = DeviceMetrics()
+        self.router = ProxyRouter()
+        self.on_device_status: Callable[[DeviceStatus], None] | None = None
+        self.commands = CommandQueue(
+            self._execute_command,
+            on_idle=self.delayed_disconnect
+        )
+        self.retry_policy = RetryPolicy(
+            on_state_change=lambda policy: self.eventbus.send(DEVICE_LINK_STATE, policy)
+        )
+        self.reachability = Reachability(
+            on_change=lambda reachability: self.eventbus.send(DEVICE_REACHABILITY, reachability)
+        )
+        self.battery = BatteryHistory()
+        self.tracer: Tracer | None = None
+        resolver.register(self)
+
+    def _span(self, name: str, **attributes):
+        if self.tracer is None:
+            return NO_SPAN
+        return self.tracer.span(name, self.mac, **attributes)
+
+    @asynccontextmanager
+    async def _locked(self, lock: asyncio.Lock, name: str):
+        """Hold ``lock``, tracing the time spent waiting for it as ``name``."""
+        with self._span(name):
+            await lock.acquire()
+        try:
+            yield
+        finally:
+            lock.release()
 
     async def connect(self) -> bool:
         _LOGGER.debug("Trying to connect to device %s...", self.mac)
-        
-        async with self._connect_lock:
-            if self.client and self.client.is_connected:
-                _LOGGER.debug("Already connected to %s", self.mac)
+
+        with self._span("connect") as span:
+            async with self._locked(self._connect_lock, "connect_lock"):
+                if self.client and self.client.is_connected:
+                    _LOGGER.debug("Already connected to %s", self.mac)
+                    span.set(reused=True, proxy=self.source)
+                    return True
+
+                if not self.retry_policy.allow_attempt():
+                    if self.retry_policy.state == STATE_OPEN:
+                        raise BackingOffError(f"{self.mac} is unreachable, waiting for it to advertise")
+                    raise BackingOffError(
+                        f"Not retrying {self.mac} for another {self.retry_policy.retry_in:.0f}s"
+                    )
+
+                try:
+                    await self._connect()
+                except Exception as e:
+                    self.metrics.failures += 1
+                    self.retry_policy.record_failure(e)
+                    raise
+                finally:
+                    span.set(proxy=self.source)
+
+                self.retry_policy.record_success()
                 return True
 
-            device = async_ble_device_from_address(
-                self.hass, self.mac
-            )
-            self.client = BleakClient(
-                device,
-                disconnected_callback=self._on_disconnect
-            )
+    async def _connect(self):
+        routes = self.router.rank(
+            self.resolver.routes(self.mac),
+            self.scheduler.free_slots()
+        )
+        if not routes:
+            raise ConnectionError(f"Device {self.mac} is not in range")
 
-            _LOGGER.debug("Connecting to %s...", self.mac)
+        self._release_slot()
+        for index, route in enumerate(routes):
             try:
-                await self.client.connect()
-            except Exception as e:
-                _LOGGER.debug("Failed to connect to %s: %s", self.mac, e)
-                raise ConnectionError(f"Failed to connect to device: {e}") from e
-
-            await asyncio.sleep(2.0)  # give some time for service discovery
-
-            _LOGGER.debug("Connected to %s, discovering services...", self.mac)
+                await self._connect_via(route)
+                break
+            except ConnectionError:
+                if index == len(routes) - 1:
+                    raise
+                _LOGGER.debug(
+                    "Trying %s via %s instead", self.mac, routes[index + 1].source
+                )
 
-            services = self.client.services
-            if not MAIN_SVC in [service.uuid for service in services]:
-                await self.client.disconnect()
-                raise InvalidDeviceError("Device does not look right")
+        connected = time.monotonic()
 
-            self.eventbus.send(DEVICE_CONNECT, self)
+        try:
+            with self._span("ready"):
+                await self._wait_until_ready()
+        except InvalidDeviceError:
+            await self.client.clear_cache()
+            await self._abort_connection()
+            raise
+        except Exception as e:
+            _LOGGER.debug("%s did not become ready: %s", self.mac, e)
+            await self._abort_connection()
+            raise ConnectionError(f"Device is not ready: {e}") from e
+
+        self.metrics.link_setup.add(time.monotonic() - connected)
+        self.reachability.on_connected()
+        self.eventbus.send(DEVICE_CONNECT, self)
+
+        await self.get_device_status()
+
+    async def _connect_via(self, route: Route):
+        with self._span("slot_wait", proxy=route.source):
+            await self.scheduler.acquire(route.source, route.slots)
+        self._slot_source = route.source
+        self._slot_held = True
+        self.source = route.source
+
+        _LOGGER.debug("Connecting to %s via %s (%s dBm)...", self.mac, route.source, route.rssi)
+        started = time.monotonic()
+        try:
+            with self._span("establish", proxy=route.source, rssi=route.rssi):
+                self.client = await self._establish_client(route)
+        except Exception as e:
+            _LOGGER.debug("Failed to connect to %s via %s: %s", self.mac, route.source, e)
+            self._release_slot()
+            self.router.record_failure(route.source, e)
+            raise ConnectionError(f"Failed to connect to device: {e}") from e
+
+        latency = time.monotonic() - started
+        if self.capture is not None:
+            self.capture.record(capture.CONNECT, note=str(route.source))
+        self.router.record_success(route.source, latency)
+        self.metrics.connect_latency.add(latency)
+        self.metrics.record_connected()
+
+    def _route_device(self, route: Route):
+        """The freshest BLEDevice of the same proxy, for connection retries."""
+        for candidate in self.resolver.routes(self.mac):
+            if candidate.source == route.source:
+                return candidate.device
+        return route.device
+
+    async def _establish_client(self, route: Route) -> BleakClient:
+        return await establish_connection(
+            BleakClientWithServiceCache,
+            route.device,
+            self.mac,
+            disconnected_callback=self._on_disconnect,
+            ble_device_callback=lambda: self._route_device(route)
+        )
 
-            try:
-                _LOGGER.debug("Subscribing to notifications on %s...", NOTIFY_CHAR)
+    async def _wait_until_ready(self):
+        """Resolve the GATT characteristics and subscribe to notifications.
+
+        Bleak only returns from connect once service discovery is complete,
+        so the services are usable as soon as the main service shows up.
+        """
+        services = self.client.services
+        if services.get_service(MAIN_SVC) is None:
+            raise InvalidDeviceError("Device does not look right")
+
+        self._notify_char = services.get_characteristic(NOTIFY_CHAR)
+        self._write_char = services.get_characteristic(WRITE_CHAR)
+        if self._notify_char is None or self._write_char is None:
+            raise InvalidDeviceError("Device does not look right")
+
+        with self._span("mtu") as span:
+            await self._negotiate_mtu()
+            span.set(mtu=self.mtu)
+        self._reassembler.reset()
+        _LOGGER.debug("Subscribing to notifications on %s...", NOTIFY_CHAR)
+        try:
+            with self._span("start_notify"):
                 await self.client.start_notify(
-                    NOTIFY_CHAR,
+                    self._notify_char,
                     self._notification_handler
                 )
-            except Exception:
-                # This always triggers an error for some reason
-                # (Characteristic 6e400001-b5a3-f393-e0a9-e50e24dcca9e
-                # does not have a characteristic client config descriptor),
-                # but notifications are enabled anyway.
-                pass
-
-            await self.get_device_status()
+        except BleakError as e:
+            # The device does not expose a client characteristic configuration
+            # descriptor, so some backends refuse the subscription even though
+            # notifications are delivered anyway.
+            _LOGGER.debug("Subscribing to %s reported: %s", NOTIFY_CHAR, e)
+
+    async def _negotiate_mtu(self):
+        """Get the largest MTU the link supports.
+
+        ESPHome proxies negotiate it while connecting. BlueZ only does when
+        asked, through a backend method bleak does not expose publicly.
+        """
+        acquire_mtu = getattr(getattr(self.client, "_backend", None), "_acquire_mtu", None)
+        if acquire_mtu is not None:
+            try:
+                await acquire_mtu()
+            except Exception as e:
+                _LOGGER.debug("Could not negotiate the MTU with %s: %s", self.mac, e)
+        self.mtu = self.client.mtu_size or DEFAULT_MTU
+        _LOGGER.debug("MTU of %s is %s", self.mac, self.mtu)
 
-            return True
+    async def _abort_connection(self):
+        try:
+            await self.client.disconnect()
+        finally:
+            self._release_slot()
 
     async def connect_if_needed(self) -> bool:
         if not self.device_status or not self.device_status.is_valid:
-            await self.connect()
+            if self.client and self.client.is_connected:
+                # Kept connected, only the status needs refreshing
+                await self.refresh_status()
+            else:
+                await self.connect()
             return True
 
         return False
@@ -111,73 +306,257 @@ class SmartMatic:
         _LOGGER.debug("%s already disconnected.", self.mac)
         return False
 
+    async def close(self):
+        """Stop all background work and drop the connection."""
+        self.commands.cancel()
+        if self._disconnect_task is not None:
+            self._disconnect_task.cancel()
+        self.eventbus.close()
+        self.resolver.unregister(self)
+        await self.disconnect()
+        if self.capture is not None:
+            await self.capture.close()
+
     async def delayed_disconnect(self):
-        async def _delayed_disconnect():
-            if not self.client.is_connected:
-                _LOGGER.debug("%s already disconnected, skipping delayed disconnect.", self.mac)
+        if not self.client or not self.client.is_connected:
+            _LOGGER.debug("%s already disconnected, skipping delayed disconnect.", self.mac)
+            return
+
+        with self._span("delayed_disconnect") as span:
+            if self._disconnect_task is not None:
+                self._disconnect_task.cancel()
+                self._disconnect_task = None
+            if self._slot_held:
+                # Idle from here on, another device may take the slot over
+                self.scheduler.set_idle(self._slot_source, self._yield_slot)
+
+            delay = self.connection_policy.idle_time()
+            span.set(idle_time=delay)
+            if delay is None:
+                _LOGGER.debug("Keeping %s connected", self.mac)
                 return
+            _LOGGER.debug("Scheduling delayed disconnect from %s...", self.mac)
+            self._disconnect_task = asyncio.get_running_loop().create_task(
+                self._disconnect_after(delay)
+            )
 
-            try:
-                _LOGGER.debug("Waiting %ss before disconnecting from %s...", DISCONNECT_DELAY, self.mac)
-                await asyncio.sleep(DISCONNECT_DELAY)
-                await self.disconnect()
-            except Exception as e:
-                _LOGGER.debug("Failed to disconnect. Error: %s", e)
-
-        _LOGGER.debug("Scheduling delayed disconnect from %s...", self.mac)
-        loop = asyncio.get_running_loop()
+    async def _disconnect_after(self, delay: float):
+        try:
+            _LOGGER.debug("Waiting %ss before disconnecting from %s...", delay, self.mac)
+            await asyncio.sleep(delay)
+            if self.commands.pending:
+                # The queue schedules another one once it drains
+                return
+            with self._span("disconnect", proxy=self.source):
+                async with self._gatt_lock:
+                    await self.disconnect()
+        except Exception as e:
+            _LOGGER.debug("Failed to disconnect. Error: %s", e)
+
+    def _yield_slot(self):
+        """Called by the scheduler when another device needs our idle slot."""
+        _LOGGER.debug("Releasing the idle connection to %s for another device", self.mac)
         if self._disconnect_task is not None:
             self._disconnect_task.cancel()
-        self._disconnect_task = loop.create_task(_delayed_disconnect())
+        self._disconnect_task = asyncio.get_running_loop().create_task(
+            self._disconnect_after(0)
+        )
+
+    def _mark_busy(self):
+        if self._slot_held:
+            self.scheduler.clear_idle(self._slot_source, self._yield_slot)
 
     async def get_device_status(self):
         _LOGGER.debug("Getting device status from %s...", self.mac)
-        
-        # Reset the event before waiting for new status
-        self._device_status_event.clear()
 
-        _LOGGER.debug("Writing to %s on %s...", WRITE_CHAR, self.mac)
-        await self.client.write_gatt_char(
-            WRITE_CHAR,
-            bytes.fromhex("bf626d54186b626d4e189dff")
-        )
-        
+        with self._span("get_device_status", proxy=self.source):
+            async with self._locked(self._gatt_lock, "gatt_lock"):
+                # Reset the event before waiting for new status
+                self._device_status_event.clear()
+                await self._request_status()
+
+        await self.delayed_disconnect()
+
+    async def trigger(self, read_status: bool = False) -> CommandResult:
+        """Spray once, optionally reading the status back on the same link."""
+        _LOGGER.debug("Triggering device %s...", self.mac)
+        command = COMMAND_TRIGGER_AND_STATUS if read_status else COMMAND_TRIGGER
+        self.connection_policy.record_command()
+        with self._span("trigger", command=command) as span:
+            try:
+                result = await self.commands.submit(
+                    command,
+                    coalesce=self.commands.coalesce_window > 0
+                )
+            except ConnectionError as e:
+                if self.journal is None:
+                    raise
+                _LOGGER.info("%s is unreachable, will trigger it once it is back", self.mac)
+                self.journal.add(command)
+                span.set(deferred=True)
+                return CommandResult(command, error=str(e), deferred=True)
+            span.set(proxy=self.source, coalesced=result.coalesced)
+            return result
+
+    async def flush_journal(self) -> int:
+        """Send the journaled commands, returns how many were delivered."""
+        if self.journal is None:
+            return 0
+
+        delivered = 0
+        for entry in self.journal.pending():
+            try:
+                await self.commands.submit(entry.command)
+            except ConnectionError as e:
+                _LOGGER.debug("Could not deliver journaled %s to %s: %s", entry.command, self.mac, e)
+                break
+            except UnconfirmedCommandError as e:
+                # The frame went out, sending it again could spray twice
+                _LOGGER.warning("Journaled %s to %s not confirmed: %s", entry.command, self.mac, e)
+                self.journal.remove(entry)
+                continue
+            self.journal.remove(entry)
+            delivered += 1
+        return delivered
+
+    async def refresh_status(self) -> CommandResult:
+        return await self.commands.submit(COMMAND_STATUS, coalesce=True)
+
+    async def send_command(
+        self,
+        message_type: int,
+        message_number: int,
+        fields: dict | None = None,
+        wait_for_reply: bool = True
+    ) -> bytes | None:
+        """Send any keyed command and return the first frame the device answers with.
+
+        For the parts of the protocol that are not known yet, like the
+        dispenser's own spray interval and clock settings.
+        """
+        frame = protocol.encode({
+            protocol.MESSAGE_TYPE: message_type,
+            protocol.MESSAGE_NUMBER: message_number,
+            **(fields or {})
+        })
+        # Queued like any other command, never coalesced
+        result = await self.commands.submit(COMMAND_RAW, frame, wait_for_reply)
+        return result.reply
+
+    async def _send_raw(self, frame: bytes, wait_for_reply: bool) -> bytes | None:
+        async with self._locked(self._gatt_lock, "gatt_lock"):
+            self._reply = asyncio.get_running_loop().create_future()
+            try:
+                # Without a reply to wait for, the write response is all we get
+                await self._write(frame, acknowledged=not wait_for_reply)
+                if not wait_for_reply:
+                    return None
+                return await asyncio.wait_for(self._reply, self.status_timeout)
+            except asyncio.TimeoutError as e:
+                raise UnconfirmedCommandError(
+                    f"{self.mac} did not answer {frame.hex()}"
+                ) from e
+            finally:
+                self._reply = None
+
+    async def _execute_command(self, command: str, *args) -> bytes | None:
+        with self._span("execute", command=command):
+            connected = await self._ensure_connected()
+            self._mark_busy()
+
+            try:
+                if command == COMMAND_STATUS:
+                    if not connected:
+                        await self.get_device_status()
+                    return None
+                if command == COMMAND_RAW:
+                    return await self._send_raw(*args)
+
+                async with self._locked(self._gatt_lock, "gatt_lock"):
+                    self._device_status_event.clear()
+                    acknowledged = await self._write(protocol.TRIGGER)
+                    if command == COMMAND_TRIGGER_AND_STATUS or not acknowledged:
+                        # Pipeline the status request right behind the trigger.
+                        # Writes arrive in order, so without a write response the
+                        # status reply is what confirms the trigger arrived.
+                        try:
+                            await self._request_status()
+                        except ConnectionError as e:
+                            # Not a ConnectionError once the trigger went out, it
+                            # must not be journaled and sprayed a second time
+                            if acknowledged:
+                                raise UnconfirmedCommandError(
+                                    f"Triggered {self.mac} but could not read the status back: {e}"
+                                ) from e
+                            raise UnconfirmedCommandError(
+                                f"Trigger sent to {self.mac} but not confirmed: {e}"
+                            ) from e
+            except UnconfirmedCommandError as e:
+                # A raw command may well go unanswered, that says nothing about the link
+                if command != COMMAND_RAW:
+                    self.metrics.failures += 1
+                    self.retry_policy.record_failure(e)
+                raise
+            except Exception as e:
+                self.metrics.failures += 1
+                self.retry_policy.record_failure(e)
+                raise
+
+    async def _write(self, frame: bytes, acknowledged: bool = False) -> bool:
+        """Write a command, returns whether the device acknowledged it."""
+        _LOGGER.debug("Writing to %s on %s: %s", WRITE_CHAR, self.mac, frame.hex())
+        if self.capture is not None:
+            self.capture.record(capture.WRITE, frame)
+        response = acknowledged or not self._can_write_without_response(frame)
+        started = time.monotonic()
+        try:
+            with self._span("write", acknowledged=response, size=len(frame)):
+                await self.client.write_gatt_char(self._write_char, frame, response=response)
+        except BleakError as e:
+            raise ConnectionError(f"Failed to write to {self.mac}: {e}") from e
+        self.metrics.write_latency.add(time.monotonic() - started)
+        return response
+
+    def _can_write_without_response(self, frame: bytes) -> bool:
+        return self.write_without_response and \
+            "write-without-response" in self._write_char.properties and \
+            len(frame) <= self.mtu - ATT_HEADER_SIZE
+
+    async def _request_status(self):
+        """Ask for the status and wait for it, the caller holds the GATT lock."""
+        started = time.monotonic()
+        with self._span("status"):
+            await self._write(protocol.STATUS_REQUEST)
+            with self._span("wait_status"):
+                await self._wait_for_status()
+        self.metrics.status_round_trip.add(time.monotonic() - started)
+
+    async def _wait_for_status(self):
         try:
             _LOGGER.debug("Waiting for device status from %s...", self.mac)
-            
             await asyncio.wait_for(
                 self._device_status_event.wait(),
-                STATUS_TIMEOUT
+                self.status_timeout
             )
         except asyncio.TimeoutError as exc:
+            self.metrics.timeouts += 1
             _LOGGER.warning(
                 "Timeout waiting for device status from %s after %ss",
                 self.mac,
-                STATUS_TIMEOUT
+                self.status_timeout
             )
+            await self.delayed_disconnect()
             raise ConnectionError(
                 f"Timeout waiting for device status response from {self.mac}"
             ) from exc
 
-        await self.delayed_disconnect()
-
-    async def trigger(self):
-        _LOGGER.debug("Triggering device %s...", self.mac)
-        await self._ensure_connected()
-
-        _LOGGER.debug("Writing to %s on %s...", WRITE_CHAR, self.mac)
-        await self.client.write_gatt_char(
-            WRITE_CHAR,
-            bytes.fromhex("bf626d541868626d4e189a62724900ff")
-        )
-        _LOGGER.debug("Write complete.")
-
-        await self.delayed_disconnect()
-
-    async def _ensure_connected(self):
+    async def _ensure_connected(self) -> bool:
+        """Connect if needed, returns True when a new connection was made."""
         if not self.client or not self.client.is_connected:
             _LOGGER.debug("Not connected, connecting to %s...", self.mac)
             await self.connect()
+            return True
+        return False
         # async def wait_for_connected():
         #     while not self.client or not self.client.is_connected:
         #         try:
@@ -192,17 +571,73 @@ class SmartMatic:
         #     raise NotConnectedError("Connection timeout") from exc
 
     async def _notification_handler(self, sender, data):
-        if sender.uuid.lower() == NOTIFY_CHAR.lower():
+        if sender.uuid.lower() == NOTIFY_CHAR:
             _LOGGER.debug("<< %s: %s", sender.uuid, data.hex())
-            if len(data) == 99:
-                self.device_status = DeviceStatus(data)
-                self._device_status_event.set()
-                self.eventbus.send(DEVICE_STATUS_UPDATE, self.device_status)
+            if self.capture is not None:
+                self.capture.record(capture.NOTIFY, data)
+            for frame in self._reassembler.feed(data):
+                if self._reply is not None and not self._reply.done():
+                    self._reply.set_result(frame)
+                if len(frame) == STATUS_FRAME_LENGTH:
+                    self.set_device_status(DeviceStatus(frame))
+                    self._device_status_event.set()
+                else:
+                    _LOGGER.debug("Ignoring %s byte frame from %s", len(frame), self.mac)
+
+    def set_device_status(self, device_status: DeviceStatus):
+        previous = self.device_status
+        self.device_status = device_status
+        if device_status.battery_mv is not None:
+            # A naive date is local time, astimezone() assumes as much
+            self.battery.add(device_status.date.astimezone(), device_status.battery_mv)
+        if self.on_device_status is not None:
+            self.on_device_status(device_status)
+        # Statuses that are not CBOR have no fields, only a battery voltage
+        if previous is None or not previous.is_valid or \
+                previous.battery_mv != device_status.battery_mv or \
+                previous.fields != device_status.fields:
+            self.eventbus.send(DEVICE_STATUS_UPDATE, device_status)
+
+    def process_advertisement(self, service_info) -> bool:
+        """Handle an advertisement of the device.
+
+        It proves the device is around, so it feeds the reachability and
+        may half-open the circuit breaker. The status is refreshed from it
+        when the firmware put one there, without connecting. Returns True
+        when the advertisement carried a usable status.
+        """
+        rssi = getattr(service_info, "rssi", None)
+        self.retry_policy.on_advertisement(rssi)
+        self.reachability.on_advertisement(rssi)
+
+        device_status = parse_advertisement(service_info)
+        if device_status is None:
+            return False
+
+        _LOGGER.debug(
+            "Got status for %s from advertisement: %s mV",
+            self.mac, device_status.battery_mv
+        )
+        self.set_device_status(device_status)
+        return True
+
+    def _release_slot(self):
+        if not self._slot_held:
+            return
+        self.scheduler.clear_idle(self._slot_source, self._yield_slot)
+        self._slot_held = False
+        self.scheduler.release(self._slot_source)
+        self._slot_source = None
 
     def _on_disconnect(self, _client: BleakClient):
         if self._disconnect_task is not None:
             self._disconnect_task.cancel()
             self._disconnect_task = None
 
+        self._release_slot()
+        self._reassembler.reset()
+        self.metrics.record_disconnected()
+        if self.capture is not None:
+            self.capture.record(capture.DISCONNECT)
         self.client = None
         self.eventbus.send(DEVICE_DISCONNECT, self)
@@ -0,0 +1,83 @@
+import logging
+import time
+from dataclasses import dataclass, asdict
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TTL = 3600.0
+
+
+@dataclass
+class JournalEntry:
+    command: str
+    created: float
+    expires: float
+
+    @property
+    def expired(self) -> bool:
+        return time.time() >= self.expires
+
+
+class CommandJournal:
+    """Commands that could not be delivered, kept until the device is back.
+
+    Entries expire after their TTL and a command that is already pending is
+    not added twice, so a device that was offline for a while gets each
+    missed command at most once.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, on_change=None):
+        self.ttl = ttl
+        self.on_change = on_change
+        self._entries: list[JournalEntry] = []
+
+    def __len__(self) -> int:
+        self._purge()
+        return len(self._entries)
+
+    def add(self, command: str, ttl: float | None = None):
+        now = time.time()
+        expires = now + (self.ttl if ttl is None else ttl)
+        self._purge()
+        for entry in self._entries:
+            if entry.command == command:
+                entry.expires = max(entry.expires, expires)
+                break
+        else:
+            self._entries.append(JournalEntry(command, now, expires))
+        _LOGGER.debug("Journaled %s, %s pending", command, len(self._entries))
+        self._changed()
+
+    def pending(self) -> list[JournalEntry]:
+        self._purge()
+        return list(self._entries)
+
+    def remove(self, entry: JournalEntry):
+        if entry in self._entries:
+            self._entries.remove(entry)
+            self._changed()
+
+    def clear(self):
+        if self._entries:
+            self._entries.clear()
+            self._changed()
+
+    def as_list(self) -> list[dict]:
+        self._purge()
+        return [asdict(entry) for entry in self._entries]
+
+    def load(self, entries: list[dict]):
+        self._entries = [JournalEntry(**entry) for entry in entries]
+        self._purge()
+
+    def _purge(self):
+        expired = [entry for entry in self._entries if entry.expired]
+        for entry in expired:
+            _LOGGER.debug("Dropping expired %s from journal", entry.command)
+            self._entries.remove(entry)
+        if expired:
+            self._changed()
+
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change(self)
@@ -0,0 +1,117 @@
+import time
+from collections import deque
+
+SAMPLES = 100
+HISTOGRAM_BUCKETS = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+CONNECTION_BUCKET = 60  # Seconds per bucket of the connection rate window
+CONNECTION_WINDOW = 3600
+
+
+class RingBuffer:
+    """The last ``size`` samples of one measurement, in seconds."""
+
+    __slots__ = ("_samples", "total_count")
+
+    def __init__(self, size: int = SAMPLES):
+        self._samples: deque[float] = deque(maxlen=size)
+        self.total_count = 0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, value: float):
+        self._samples.append(value)
+        self.total_count += 1
+
+    def percentile(self, percent: float) -> float | None:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def histogram(self, buckets=HISTOGRAM_BUCKETS) -> dict[str, int]:
+        counts = {f"<={bucket}": 0 for bucket in buckets}
+        counts["inf"] = 0
+        for sample in self._samples:
+            for bucket in buckets:
+                if sample <= bucket:
+                    counts[f"<={bucket}"] += 1
+                    break
+            else:
+                counts["inf"] += 1
+        return counts
+
+    def as_dict(self) -> dict:
+        if not self._samples:
+            return {"count": self.total_count}
+        return {
+            "count": self.total_count,
+            "min": min(self._samples),
+            "mean": sum(self._samples) / len(self._samples),
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": max(self._samples),
+            "histogram": self.histogram()
+        }
+
+
+class DeviceMetrics:
+    """Timings and counters of one device's BLE traffic."""
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self.connect_latency = RingBuffer()
+        self.link_setup = RingBuffer()  # Resolving services, MTU and subscribing
+        self.write_latency = RingBuffer()
+        self.status_round_trip = RingBuffer()
+        self.timeouts = 0
+        self.failures = 0
+        self.connected_seconds = 0.0
+        self.connections = 0
+        # [bucket, count] pairs, one bucket per CONNECTION_BUCKET seconds
+        self._connection_buckets: deque[list[int]] = deque(
+            maxlen=CONNECTION_WINDOW // CONNECTION_BUCKET
+        )
+        self._connected_since: float | None = None
+
+    def record_connected(self):
+        now = self._clock()
+        self.connections += 1
+        bucket = int(now // CONNECTION_BUCKET)
+        if self._connection_buckets and self._connection_buckets[-1][0] == bucket:
+            self._connection_buckets[-1][1] += 1
+        else:
+            self._connection_buckets.append([bucket, 1])
+        self._connected_since = now
+
+    def record_disconnected(self):
+        if self._connected_since is not None:
+            self.connected_seconds += self._clock() - self._connected_since
+            self._connected_since = None
+
+    @property
+    def connections_per_hour(self) -> int:
+        since = int(self._clock() // CONNECTION_BUCKET) - CONNECTION_WINDOW // CONNECTION_BUCKET
+        return sum(count for bucket, count in self._connection_buckets if bucket > since)
+
+    @property
+    def total_connected_seconds(self) -> float:
+        """Connected time, including the connection that is still open."""
+        if self._connected_since is None:
+            return self.connected_seconds
+        return self.connected_seconds + self._clock() - self._connected_since
+
+    def as_dict(self) -> dict:
+        return {
+            "connect_latency": self.connect_latency.as_dict(),
+            "link_setup": self.link_setup.as_dict(),
+            "write_latency": self.write_latency.as_dict(),
+            "status_round_trip": self.status_round_trip.as_dict(),
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+            "connections": self.connections,
+            "connections_per_hour": self.connections_per_hour,
+            "connected_seconds": round(self.total_connected_seconds, 1)
+        }
@@ -0,0 +1,226 @@
+"""CBOR codec for the Smart Matic GATT protocol.
+
+Commands and responses are CBOR indefinite-length maps keyed by short
+strings, e.g. ``{"mT": 107, "mN": 157}`` asks the device for its status.
+"""
+import struct
+from functools import lru_cache
+from typing import Any, Iterator
+
+MESSAGE_TYPE = "mT"
+MESSAGE_NUMBER = "mN"
+
+BREAK = 0xFF
+
+_FLOAT = {25: ">e", 26: ">f", 27: ">d"}
+_SIMPLE = {20: False, 21: True, 22: None, 23: None}
+
+
+class CBORDecodeError(ValueError):
+    """Raised when the data is not valid CBOR."""
+
+
+class IncompleteFrameError(CBORDecodeError):
+    """Raised when the data ends before the CBOR item is complete."""
+
+
+class CBORDecoder:
+    """Decodes CBOR items straight from a memoryview, without slicing copies."""
+
+    __slots__ = ("_view", "_pos")
+
+    def __init__(self, data, offset: int = 0):
+        self._view = data if isinstance(data, memoryview) else memoryview(data)
+        self._pos = offset
+
+    @property
+    def position(self) -> int:
+        return self._pos
+
+    def at_end(self) -> bool:
+        return self._pos >= len(self._view)
+
+    def peek(self) -> int:
+        if self._pos >= len(self._view):
+            raise IncompleteFrameError("Unexpected end of data")
+        return self._view[self._pos]
+
+    def _take(self, length: int) -> memoryview:
+        end = self._pos + length
+        if end > len(self._view):
+            raise IncompleteFrameError("Unexpected end of data")
+        chunk = self._view[self._pos:end]
+        self._pos = end
+        return chunk
+
+    def _read_head(self) -> tuple[int, int, int | None]:
+        initial = self.peek()
+        self._pos += 1
+        major, info = initial >> 5, initial & 0x1F
+        if info < 24:
+            return major, info, info
+        if info <= 27:
+            size = 1 << (info - 24)
+            chunk = self._take(size)
+            if major == 7 and size > 1:
+                return major, info, chunk
+            return major, info, int.from_bytes(chunk, "big")
+        if info == 31:
+            return major, info, None
+        raise CBORDecodeError(f"Invalid additional info {info} at {self._pos - 1}")
+
+    def _read_break(self) -> bool:
+        if self.peek() == BREAK:
+            self._pos += 1
+            return True
+        return False
+
+    def decode(self) -> Any:
+        """Decode the next item and advance past it."""
+        major, info, arg = self._read_head()
+
+        if major == 0:
+            return arg
+        if major == 1:
+            return -1 - arg
+        if major in (2, 3):
+            if arg is None:
+                chunks = []
+                while not self._read_break():
+                    chunks.append(self.decode())
+                return (b"" if major == 2 else "").join(chunks)
+            chunk = self._take(arg)
+            return bytes(chunk) if major == 2 else str(chunk, "utf-8")
+        if major == 4:
+            if arg is None:
+                items = []
+                while not self._read_break():
+                    items.append(self.decode())
+                return items
+            return [self.decode() for _ in range(arg)]
+        if major == 5:
+            return {key: value for key, value, _ in self._iter_map(arg)}
+        if major == 6:
+            # Tags carry no meaning for this device, return the tagged item
+            return self.decode()
+
+        if info in _FLOAT:
+            return struct.unpack(_FLOAT[info], arg)[0]
+        if arg is None:
+            raise CBORDecodeError(f"Unexpected break at {self._pos - 1}")
+        return _SIMPLE.get(arg, arg)
+
+    def _iter_map(self, length: int | None) -> Iterator[tuple[Any, Any, int]]:
+        count = 0
+        while True:
+            if length is None:
+                if self._read_break():
+                    return
+            elif count >= length:
+                return
+            key = self.decode()
+            offset = self._pos
+            yield key, self.decode(), offset
+            count += 1
+
+    def iter_map(self) -> Iterator[tuple[Any, Any, int]]:
+        """Yield ``(key, value, value_offset)`` for each entry of the next map."""
+        major, _, arg = self._read_head()
+        if major != 5:
+            raise CBORDecodeError(f"Expected a map, got major type {major}")
+        return self._iter_map(arg)
+
+    def skip(self) -> int:
+        """Skip over the next item and return its encoded length."""
+        start = self._pos
+        self.decode()
+        return self._pos - start
+
+
+def decode(data) -> Any:
+    return CBORDecoder(data).decode()
+
+
+def frame_length(data) -> int | None:
+    """Return the length of the first complete CBOR item in data.
+
+    Returns None when more bytes are needed to complete it.
+    """
+    try:
+        return CBORDecoder(data).skip()
+    except IncompleteFrameError:
+        return None
+
+
+def _encode_head(out: bytearray, major: int, value: int):
+    if value < 24:
+        out.append((major << 5) | value)
+    elif value < 0x100:
+        out.append((major << 5) | 24)
+        out.append(value)
+    elif value < 0x10000:
+        out.append((major << 5) | 25)
+        out += value.to_bytes(2, "big")
+    elif value < 0x100000000:
+        out.append((major << 5) | 26)
+        out += value.to_bytes(4, "big")
+    else:
+        out.append((major << 5) | 27)
+        out += value.to_bytes(8, "big")
+
+
+def _encode(out: bytearray, value: Any):
+    if value is False or value is True or value is None:
+        out.append(0xF4 if value is False else 0xF5 if value is True else 0xF6)
+    elif isinstance(value, int):
+        if value >= 0:
+            _encode_head(out, 0, value)
+        else:
+            _encode_head(out, 1, -1 - value)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        _encode_head(out, 2, len(value))
+        out += value
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8")
+        _encode_head(out, 3, len(encoded))
+        out += encoded
+    elif isinstance(value, (list, tuple)):
+        _encode_head(out, 4, len(value))
+        for item in value:
+            _encode(out, item)
+    elif isinstance(value, dict):
+        # The device speaks indefinite-length maps
+        out.append(0xBF)
+        for key, item in value.items():
+            _encode(out, key)
+            _encode(out, item)
+        out.append(BREAK)
+    elif isinstance(value, float):
+        out.append(0xFB)
+        out += struct.pack(">d", value)
+    else:
+        raise TypeError(f"Cannot encode {type(value).__name__} as CBOR")
+
+
+def encode(value: Any) -> bytes:
+    out = bytearray()
+    _encode(out, value)
+    return bytes(out)
+
+
+@lru_cache(maxsize=64)
+def _command_frame(message_type: int, message_number: int, fields: tuple) -> bytes:
+    return encode({
+        MESSAGE_TYPE: message_type,
+        MESSAGE_NUMBER: message_number,
+        **dict(fields)
+    })
+
+
+def command_frame(message_type: int, message_number: int, **fields) -> bytes:
+    """Return the encoded command, built once and cached afterwards."""
+    return _command_frame(message_type, message_number, tuple(fields.items()))
+
+
+STATUS_REQUEST = command_frame(107, 157)
+TRIGGER = command_frame(104, 154, rI=0)
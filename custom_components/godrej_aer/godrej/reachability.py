@@ -0,0 +1,85 @@
+import time
+
+REACHABLE_RSSI = -90  # Smoothed RSSI a device has to reach to count as reachable
+UNREACHABLE_RSSI = -97  # and drop below to count as unreachable again
+UNREACHABLE_AFTER = 300  # Seconds without advertisements
+RSSI_SMOOTHING = 0.3
+
+
+class Reachability:
+    """Whether a device can be reached, from its advertisements.
+
+    Connections coming and going say little about that, a device can
+    advertise fine between two polls. Instead the RSSI is smoothed and
+    compared against two thresholds, so a signal hovering around one of
+    them does not flip the state, and a device only becomes unreachable
+    once it has not been heard for ``unreachable_after`` seconds.
+    """
+
+    def __init__(
+        self,
+        reachable_rssi: int = REACHABLE_RSSI,
+        unreachable_rssi: int = UNREACHABLE_RSSI,
+        unreachable_after: float = UNREACHABLE_AFTER,
+        on_change=None,
+        clock=time.monotonic
+    ):
+        self.reachable_rssi = reachable_rssi
+        self.unreachable_rssi = unreachable_rssi
+        self.unreachable_after = unreachable_after
+        self.on_change = on_change
+        self._clock = clock
+
+        self.reachable = False
+        self.rssi: float | None = None
+        self.last_seen: float | None = None
+
+    @property
+    def expires_in(self) -> float | None:
+        """Seconds until the device counts as gone, None when it already is."""
+        if not self.reachable or self.last_seen is None:
+            return None
+        return max(0.0, self.last_seen + self.unreachable_after - self._clock())
+
+    def on_advertisement(self, rssi: int | None, seen_at: float | None = None):
+        """``seen_at`` is when it was received, on the same clock, if not just now."""
+        self.last_seen = seen_at if seen_at is not None else self._clock()
+        if rssi is not None:
+            if self.rssi is None:
+                self.rssi = float(rssi)
+            else:
+                self.rssi += RSSI_SMOOTHING * (rssi - self.rssi)
+        self.update()
+
+    def on_connected(self):
+        """A working connection proves the device is in range, whatever the RSSI."""
+        self.last_seen = self._clock()
+        self._set(True)
+
+    def update(self) -> bool:
+        """Re-evaluate the state, returns whether it is reachable."""
+        if self.last_seen is None or \
+                self._clock() - self.last_seen >= self.unreachable_after:
+            self._set(False)
+        elif self.rssi is None:
+            self._set(True)
+        elif self.reachable:
+            self._set(self.rssi >= self.unreachable_rssi)
+        else:
+            self._set(self.rssi >= self.reachable_rssi)
+        return self.reachable
+
+    def _set(self, reachable: bool):
+        if reachable == self.reachable:
+            return
+        self.reachable = reachable
+        if self.on_change is not None:
+            self.on_change(self)
+
+    def as_dict(self) -> dict:
+        return {
+            "reachable": self.reachable,
+            "rssi": round(self.rssi, 1) if self.rssi is not None else None,
+            "seconds_since_seen": round(self._clock() - self.last_seen, 1)
+            if self.last_seen is not None else None
+        }
@@ -0,0 +1,97 @@
+import logging
+import time
+
+from .devicestatus import STATUS_FRAME_LENGTH
+from .protocol import CBORDecodeError, IncompleteFrameError, CBORDecoder
+
+_LOGGER = logging.getLogger(__name__)
+
+MAP_START = 0xBF
+MAX_BUFFER_SIZE = 512
+STALE_FRAGMENT_TIMEOUT = 2.0
+
+
+class FrameReassembler:
+    """Rebuilds CBOR frames from notifications split by a small ATT MTU.
+
+    Fragments are appended to a bounded buffer until a complete CBOR map
+    can be decoded from it. A partial frame that does not get completed
+    within ``stale_after`` seconds is dropped. A whole status frame that is
+    not CBOR is passed on as it is, DeviceStatus reads the battery voltage
+    of those from its fixed offset.
+    """
+
+    def __init__(
+        self,
+        max_size: int = MAX_BUFFER_SIZE,
+        stale_after: float = STALE_FRAGMENT_TIMEOUT,
+        clock=time.monotonic
+    ):
+        self.max_size = max_size
+        self.stale_after = stale_after
+        self._clock = clock
+        self._buffer = bytearray()
+        self._last_fragment = 0.0
+
+    def reset(self):
+        self._buffer.clear()
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def feed(self, data) -> list[bytes]:
+        """Add a notification and return the frames it completed."""
+        now = self._clock()
+        if self._buffer and now - self._last_fragment > self.stale_after:
+            _LOGGER.debug("Dropping %s stale bytes of a partial frame", len(self._buffer))
+            self._buffer.clear()
+        self._last_fragment = now
+
+        if not self._buffer and len(data) == STATUS_FRAME_LENGTH and data[0] != MAP_START:
+            return [bytes(data)]
+
+        self._buffer += data
+        frames = []
+        while self._buffer:
+            if self._buffer[0] != MAP_START:
+                self._resync()
+                continue
+
+            length = self._frame_length()
+            if length is None:
+                if len(self._buffer) > self.max_size:
+                    _LOGGER.debug("Frame exceeds %s bytes, dropping it", self.max_size)
+                    self._buffer.clear()
+                break
+            if length == 0:
+                self._resync(1)
+                continue
+
+            frames.append(bytes(self._buffer[:length]))
+            del self._buffer[:length]
+        return frames
+
+    def _frame_length(self) -> int | None:
+        """Length of the complete frame at the start of the buffer.
+
+        None means more fragments are needed, 0 means the data is corrupt.
+        """
+        with memoryview(self._buffer) as view:
+            decoder = CBORDecoder(view)
+            try:
+                decoder.skip()
+                length = decoder.position
+            except IncompleteFrameError:
+                length = None
+            except CBORDecodeError:
+                length = 0
+            del decoder
+        return length
+
+    def _resync(self, skip: int = 0):
+        start = self._buffer.find(MAP_START, skip)
+        if start < 0:
+            self._buffer.clear()
+        else:
+            del self._buffer[:start]
@@ -0,0 +1,166 @@
+"""Finding a device and the adapter that can reach it.
+
+SmartMatic does not scan by itself, it asks a DeviceResolver for the
+BLEDevice to connect to. Inside Home Assistant that is the bluetooth
+integration, a standalone gateway can use ScannerResolver with its own
+BleakScanner.
+"""
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from bleak import BleakScanner
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class Route:
+    """One adapter or proxy that can connect to a device."""
+
+    device: BLEDevice
+    source: str | None = None
+    rssi: int | None = None
+    slots: int | None = None
+    free: int | None = None
+
+
+class DeviceResolver(ABC):
+    """Tells SmartMatic how to reach a device."""
+
+    @abstractmethod
+    def ble_device(self, address: str) -> BLEDevice | None:
+        """The device to connect to, or None when it is out of range."""
+
+    def connection_source(self, address: str) -> tuple[str | None, int | None]:
+        """The adapter or proxy that will carry the connection and its slots."""
+        return None, None
+
+    def routes(self, address: str) -> list[Route]:
+        """Every adapter or proxy the device was recently seen by.
+
+        Resolvers that only know a single path return just that one.
+        """
+        device = self.ble_device(address)
+        if device is None:
+            return []
+        source, slots = self.connection_source(address)
+        return [Route(device, source, getattr(device, "rssi", None), slots)]
+
+    def register(self, smartmatic):
+        """Called by every SmartMatic using this resolver.
+
+        Resolvers that see advertisements pass them on to the device's
+        SmartMatic.process_advertisement.
+        """
+
+    def unregister(self, smartmatic):
+        pass
+
+
+class ScannerResolver(DeviceResolver):
+    """Resolves devices from the advertisements of a local BleakScanner.
+
+    Devices not seen for ``expire_after`` seconds count as out of range.
+    Advertisements of registered devices go to their
+    SmartMatic.process_advertisement, and every advertisement is also
+    passed on to ``on_advertisement``.
+    """
+
+    def __init__(
+        self,
+        adapter: str | None = None,
+        expire_after: float = 300,
+        slots: int | None = None,
+        on_advertisement=None,
+        clock=time.monotonic
+    ):
+        self.adapter = adapter
+        self.expire_after = expire_after
+        self.slots = slots
+        self.on_advertisement = on_advertisement
+        self._clock = clock
+        self._devices: dict[str, tuple[BLEDevice, int, float]] = {}
+        self._smartmatics: dict[str, object] = {}
+        self._scanner: BleakScanner | None = None
+
+    @property
+    def source(self) -> str:
+        return self.adapter or "local"
+
+    async def start(self):
+        if self._scanner is not None:
+            return
+        kwargs = {"adapter": self.adapter} if self.adapter else {}
+        self._scanner = BleakScanner(detection_callback=self._detected, **kwargs)
+        await self._scanner.start()
+
+    async def stop(self):
+        if self._scanner is None:
+            return
+        scanner, self._scanner = self._scanner, None
+        await scanner.stop()
+
+    def _detected(self, device: BLEDevice, advertisement: AdvertisementData):
+        self._devices[device.address.upper()] = (
+            device, advertisement.rssi, self._clock()
+        )
+        smartmatic = self._smartmatics.get(device.address.upper())
+        if smartmatic is not None:
+            try:
+                smartmatic.process_advertisement(advertisement)
+            except Exception:
+                _LOGGER.exception("Error processing advertisement of %s", device.address)
+        if self.on_advertisement is not None:
+            try:
+                self.on_advertisement(device, advertisement)
+            except Exception:
+                _LOGGER.exception("Error handling advertisement of %s", device.address)
+
+    def register(self, smartmatic):
+        self._smartmatics[smartmatic.mac.upper()] = smartmatic
+
+    def unregister(self, smartmatic):
+        if self._smartmatics.get(smartmatic.mac.upper()) is smartmatic:
+            del self._smartmatics[smartmatic.mac.upper()]
+
+    def ble_device(self, address: str) -> BLEDevice | None:
+        seen = self._devices.get(address.upper())
+        if seen is None:
+            return None
+        device, _rssi, seen_at = seen
+        if self._clock() - seen_at > self.expire_after:
+            return None
+        return device
+
+    def connection_source(self, address: str) -> tuple[str | None, int | None]:
+        return self.source, self.slots
+
+    def routes(self, address: str) -> list[Route]:
+        device = self.ble_device(address)
+        if device is None:
+            return []
+        _device, rssi, _seen_at = self._devices[address.upper()]
+        return [Route(device, self.source, rssi, self.slots)]
+
+
+class StaticResolver(DeviceResolver):
+    """Resolves a fixed set of devices, for tests, replays and simulations."""
+
+    def __init__(self, devices=(), source: str | None = None, slots: int | None = None):
+        self._devices = {device.address.upper(): device for device in devices}
+        self.source = source
+        self.slots = slots
+
+    def add(self, device):
+        self._devices[device.address.upper()] = device
+
+    def ble_device(self, address: str):
+        return self._devices.get(address.upper())
+
+    def connection_source(self, address: str) -> tuple[str | None, int | None]:
+        device = self.ble_device(address)
+        return getattr(device, "source", self.source), self.slots
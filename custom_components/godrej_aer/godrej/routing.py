@@ -0,0 +1,108 @@
+import logging
+import time
+
+from .resolver import Route
+
+_LOGGER = logging.getLogger(__name__)
+
+UNKNOWN_RSSI = -100
+NO_FREE_SLOT_PENALTY = 20  # dB a busy proxy has to be better by to still win
+FAILURE_PENALTY = 30  # dB lost by a proxy that never manages to connect
+MAX_ROUTES = 2  # Proxies tried per connection attempt
+LATENCY_SMOOTHING = 0.3
+
+
+class _SourceStats:
+    __slots__ = ("attempts", "successes", "latency", "last_error", "last_used")
+
+    def __init__(self):
+        self.attempts = 0
+        self.successes = 0
+        self.latency: float | None = None
+        self.last_error: str | None = None
+        self.last_used: float | None = None
+
+    @property
+    def success_rate(self) -> float:
+        # Smoothed, so a single attempt does not decide a proxy's fate
+        return (self.successes + 1) / (self.attempts + 2)
+
+    def as_dict(self) -> dict:
+        return {
+            "attempts": self.attempts,
+            "successes": self.successes,
+            "success_rate": round(self.success_rate, 2),
+            "latency": round(self.latency, 3) if self.latency is not None else None,
+            "last_error": self.last_error
+        }
+
+
+class ProxyRouter:
+    """Picks the adapter or proxy to connect to one device through.
+
+    Routes are ranked by the RSSI the proxy last heard the device with,
+    lowered when the proxy has no free connection slot and when earlier
+    connections through it kept failing.
+    """
+
+    def __init__(self, max_routes: int = MAX_ROUTES, clock=time.monotonic):
+        self.max_routes = max_routes
+        self._clock = clock
+        self._stats: dict[str | None, _SourceStats] = {}
+
+    def _source_stats(self, source: str | None) -> _SourceStats:
+        stats = self._stats.get(source)
+        if stats is None:
+            stats = self._stats[source] = _SourceStats()
+        return stats
+
+    def score(self, route: Route, free_slots: int | None = None) -> float:
+        score = float(route.rssi if route.rssi is not None else UNKNOWN_RSSI)
+        free = route.free if route.free is not None else free_slots
+        if free is not None and free <= 0:
+            score -= NO_FREE_SLOT_PENALTY
+        stats = self._stats.get(route.source)
+        if stats is not None:
+            score -= (1 - stats.success_rate) * FAILURE_PENALTY
+        return score
+
+    def rank(self, routes: list[Route], free_slots=None) -> list[Route]:
+        """Best routes first, at most ``max_routes`` of them.
+
+        ``free_slots`` maps a source to its free slots, for routes that do
+        not report them themselves.
+        """
+        free_slots = free_slots or {}
+        ranked = sorted(
+            routes,
+            key=lambda route: self.score(route, free_slots.get(route.source)),
+            reverse=True
+        )
+        if len(ranked) > 1:
+            _LOGGER.debug(
+                "Routes for %s: %s", ranked[0].device.address,
+                ", ".join(f"{route.source} ({route.rssi} dBm)" for route in ranked)
+            )
+        return ranked[:self.max_routes]
+
+    def record_success(self, source: str | None, latency: float):
+        stats = self._source_stats(source)
+        stats.attempts += 1
+        stats.successes += 1
+        stats.last_used = self._clock()
+        if stats.latency is None:
+            stats.latency = latency
+        else:
+            stats.latency += LATENCY_SMOOTHING * (latency - stats.latency)
+
+    def record_failure(self, source: str | None, error: Exception):
+        stats = self._source_stats(source)
+        stats.attempts += 1
+        stats.last_used = self._clock()
+        stats.last_error = str(error) or type(error).__name__
+
+    def as_dict(self) -> dict:
+        return {
+            str(source): stats.as_dict()
+            for source, stats in self._stats.items()
+        }
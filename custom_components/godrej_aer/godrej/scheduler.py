@@ -0,0 +1,143 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SOURCE = "default"
+DEFAULT_CONNECTION_SLOTS = 3
+
+
+class _SlotPool:
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    async def acquire(self):
+        if self.in_use < self.limit and not self.waiting:
+            self.in_use += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before we got cancelled
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+    def release(self):
+        self.in_use = max(0, self.in_use - 1)
+        self._wake()
+
+    def resize(self, limit: int):
+        self.limit = max(1, limit)
+        self._wake()
+
+    def _wake(self):
+        while self._waiters and self.in_use < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_use += 1
+            waiter.set_result(None)
+
+
+class ConnectionScheduler:
+    """Shares BLE connection slots between all Smart Matic devices.
+
+    Each Bluetooth adapter or proxy (a "source") can only hold a limited
+    number of simultaneous connections. Devices behind different sources
+    connect fully in parallel, devices behind the same source queue up
+    once all of its slots are taken.
+    """
+
+    def __init__(self, default_slots: int = DEFAULT_CONNECTION_SLOTS):
+        self.default_slots = default_slots
+        self._pools: dict[str, _SlotPool] = {}
+        # Per source, the callbacks releasing idle connections, oldest first
+        self._idle: dict[str, dict[Callable[[], None], None]] = {}
+
+    def _pool(self, source: str | None, slots: int | None = None) -> _SlotPool:
+        source = source or DEFAULT_SOURCE
+        pool = self._pools.get(source)
+        if pool is None:
+            pool = _SlotPool(slots or self.default_slots)
+            self._pools[source] = pool
+        elif slots and slots != pool.limit:
+            pool.resize(slots)
+        return pool
+
+    async def acquire(self, source: str | None, slots: int | None = None):
+        """Wait for a free connection slot on the given source."""
+        pool = self._pool(source, slots)
+        if pool.in_use >= pool.limit:
+            _LOGGER.debug(
+                "All %s connection slots of %s are busy, waiting...",
+                pool.limit, source or DEFAULT_SOURCE
+            )
+            self._release_idle(source)
+        await pool.acquire()
+
+    def release(self, source: str | None):
+        """Give a connection slot back to the given source."""
+        self._pool(source).release()
+
+    def set_idle(self, source: str | None, release: Callable[[], None]):
+        """Offer an idle connection's slot to devices that need one.
+
+        ``release`` is called once another device waits for a slot of the
+        source, and should disconnect.
+        """
+        idle = self._idle.setdefault(source or DEFAULT_SOURCE, {})
+        idle.pop(release, None)
+        idle[release] = None
+        if self._pool(source).waiting:
+            self._release_idle(source)
+
+    def clear_idle(self, source: str | None, release: Callable[[], None]):
+        idle = self._idle.get(source or DEFAULT_SOURCE)
+        if idle:
+            idle.pop(release, None)
+
+    def _release_idle(self, source: str | None):
+        idle = self._idle.get(source or DEFAULT_SOURCE)
+        if not idle:
+            return
+        release = next(iter(idle))
+        del idle[release]
+        release()
+
+    def free_slots(self) -> dict[str | None, int]:
+        """Free slots per source, for the sources that were used before."""
+        free = {
+            source: max(0, pool.limit - pool.in_use)
+            for source, pool in self._pools.items()
+        }
+        if DEFAULT_SOURCE in free:
+            free[None] = free[DEFAULT_SOURCE]
+        return free
+
+    def usage(self) -> dict[str, dict[str, int]]:
+        return {
+            source: {
+                "slots": pool.limit,
+                "in_use": pool.in_use,
+                "idle": len(self._idle.get(source, ())),
+                "waiting": pool.waiting
+            }
+            for source, pool in self._pools.items()
+        }
@@ -0,0 +1,182 @@
+"""Span tracing of the connection lifecycle.
+
+Tracing is off unless a Tracer is assigned to ``SmartMatic.tracer``. A
+tracer can be shared by a whole fleet. Finished spans are kept in a ring
+buffer and can be exported in the Chrome trace event format, which
+chrome://tracing and https://ui.perfetto.dev open. Each device shows up
+as a process and each asyncio task as a thread within it, so the spans
+of one row always nest.
+
+``on_span`` is called with every finished span, for handing them to
+another tracing system such as OpenTelemetry.
+"""
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable
+
+from .metrics import RingBuffer
+
+MAX_SPANS = 10000
+
+OUTCOME_OK = "ok"
+OUTCOME_CANCELLED = "cancelled"
+
+
+class Span:
+    __slots__ = ("name", "device", "task", "start", "end", "attributes", "outcome")
+
+    def __init__(self, name: str, device: str, task: str, start: float, attributes: dict):
+        self.name = name
+        self.device = device
+        self.task = task
+        self.start = start
+        self.end: float | None = None
+        self.attributes = attributes
+        self.outcome: str | None = None
+
+    @property
+    def duration(self) -> float | None:
+        return None if self.end is None else self.end - self.start
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "device": self.device,
+            "task": self.task,
+            "start": self.start,
+            "duration": self.duration,
+            "outcome": self.outcome,
+            "attributes": dict(self.attributes)
+        }
+
+
+class _NoSpan:
+    """Stands in for a span while tracing is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set(self, **attributes):
+        pass
+
+
+NO_SPAN = _NoSpan()
+
+
+class Tracer:
+    def __init__(
+        self,
+        max_spans: int = MAX_SPANS,
+        on_span: Callable[[Span], None] | None = None,
+        clock=time.perf_counter
+    ):
+        self.on_span = on_span
+        self._clock = clock
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+
+    @property
+    def spans(self) -> list[Span]:
+        return list(self._spans)
+
+    def clear(self):
+        self._spans.clear()
+
+    @contextmanager
+    def span(self, name: str, device: str, **attributes):
+        """Time the enclosed block, the outcome is the exception it raised, if any."""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        span = Span(
+            name,
+            device,
+            task.get_name() if task is not None else "main",
+            self._clock(),
+            attributes
+        )
+        try:
+            yield span
+        except asyncio.CancelledError:
+            span.outcome = OUTCOME_CANCELLED
+            raise
+        except Exception as e:
+            span.outcome = type(e).__name__
+            raise
+        else:
+            span.outcome = OUTCOME_OK
+        finally:
+            span.end = self._clock()
+            self._spans.append(span)
+            if self.on_span is not None:
+                self.on_span(span)
+
+    def summary(self) -> dict:
+        """Latency percentiles and failures per span name, over the buffered spans."""
+        durations: dict[str, RingBuffer] = {}
+        failures: dict[str, int] = {}
+        for span in self._spans:
+            durations.setdefault(span.name, RingBuffer(len(self._spans))).add(span.duration)
+            if span.outcome != OUTCOME_OK:
+                failures[span.name] = failures.get(span.name, 0) + 1
+        return {
+            name: {
+                "count": len(buffer),
+                "failures": failures.get(name, 0),
+                "p50": buffer.percentile(50),
+                "p90": buffer.percentile(90),
+                "p99": buffer.percentile(99),
+                "max": buffer.percentile(100)
+            }
+            for name, buffer in sorted(durations.items())
+        }
+
+    def as_chrome_trace(self) -> dict:
+        events = []
+        pids: dict[str, int] = {}
+        tids: dict[tuple[str, str], int] = {}
+        spans = sorted(self._spans, key=lambda span: span.start)
+        origin = spans[0].start if spans else 0.0
+
+        for span in spans:
+            if span.device not in pids:
+                pids[span.device] = len(pids) + 1
+                events.append({
+                    "name": "process_name", "ph": "M", "pid": pids[span.device],
+                    "args": {"name": span.device}
+                })
+            pid = pids[span.device]
+            if (span.device, span.task) not in tids:
+                tids[(span.device, span.task)] = len(tids) + 1
+                events.append({
+                    "name": "thread_name", "ph": "M", "pid": pid,
+                    "tid": tids[(span.device, span.task)], "args": {"name": span.task}
+                })
+            events.append({
+                "name": span.name,
+                "cat": "smartmatic",
+                "ph": "X",
+                "ts": round((span.start - origin) * 1e6, 1),
+                "dur": round(span.duration * 1e6, 1),
+                "pid": pid,
+                "tid": tids[(span.device, span.task)],
+                "args": {"outcome": span.outcome, **span.attributes}
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str):
+        """Blocking, run it in an executor when on the event loop."""
+        trace = self.as_chrome_trace()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(trace, file, default=str)
@@ -0,0 +1,65 @@
+"""Resolves Smart Matic devices through the Home Assistant bluetooth integration."""
+from __future__ import annotations
+
+from homeassistant.components.bluetooth import (
+    async_ble_device_from_address,
+    async_last_service_info
+)
+from homeassistant.core import HomeAssistant, callback
+
+try:
+    from homeassistant.components.bluetooth import async_current_allocations
+except ImportError:  # Home Assistant < 2025.1
+    async_current_allocations = None
+
+from .const import DOMAIN
+from .godrej.resolver import DeviceResolver, Route
+
+
+class HomeAssistantResolver(DeviceResolver):
+    """Looks devices up among the adapters and proxies known to Home Assistant."""
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+
+    def ble_device(self, address: str):
+        return async_ble_device_from_address(self.hass, address, connectable=True)
+
+    def connection_source(self, address: str) -> tuple[str | None, int | None]:
+        service_info = async_last_service_info(self.hass, address, connectable=True)
+        if service_info is None:
+            return None, None
+        slots, _free = self._allocation(service_info.source)
+        return service_info.source, slots
+
+    def routes(self, address: str) -> list[Route]:
+        """Only the path Home Assistant picks itself.
+
+        Its BleakClient wrapper keeps just the address of the BLEDevice it
+        is given and connects through the scanner it considers best, so
+        offering other proxies would book slots and record statistics
+        against a proxy that is not actually used.
+        """
+        device = self.ble_device(address)
+        service_info = async_last_service_info(self.hass, address, connectable=True)
+        if device is None or service_info is None:
+            return super().routes(address)
+        slots, free = self._allocation(service_info.source)
+        return [Route(device, service_info.source, service_info.rssi, slots, free)]
+
+    def _allocation(self, source: str) -> tuple[int | None, int | None]:
+        if async_current_allocations is None:
+            return None, None
+        allocations = async_current_allocations(self.hass, source)
+        if not allocations:
+            return None, None
+        return allocations[0].slots, allocations[0].free
+
+
+@callback
+def async_get_resolver(hass: HomeAssistant) -> HomeAssistantResolver:
+    """Return the resolver shared by all Smart Matic devices."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "resolver" not in domain_data:
+        domain_data["resolver"] = HomeAssistantResolver(hass)
+    return domain_data["resolver"]
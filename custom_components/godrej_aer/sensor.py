@@ -1,22 +1,61 @@
 from __future__ import annotations
 
-from homeassistant.const import UnitOfElectricPotential, CONF_NAME
-from homeassistant.components.sensor import SensorEntity
+from datetime import timedelta
+
+from homeassistant.const import PERCENTAGE, UnitOfElectricPotential, UnitOfTime, CONF_NAME
+from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 
+from .const import BATTERY_LEVEL_STEP, BATTERY_VOLTAGE_DEADBAND
 from .entity import async_device_device_info_fn
 from .godrej import SmartMatic, DeviceStatus
-from .godrej.events import DEVICE_STATUS_UPDATE
+from .godrej.backoff import RetryPolicy, STATES
+from .godrej.battery import battery_level
+from .godrej.events import DEVICE_STATUS_UPDATE, DEVICE_LINK_STATE, DEVICE_DISCONNECT
+
+
+def _rounded(value: float | None) -> float | None:
+    return None if value is None else round(value, 3)
+
+# key, name, unit, value
+METRIC_SENSORS = [
+    ("connect_latency", "Connect Latency", UnitOfTime.SECONDS,
+     lambda metrics: _rounded(metrics.connect_latency.percentile(50))),
+    ("status_round_trip", "Status Round Trip", UnitOfTime.SECONDS,
+     lambda metrics: _rounded(metrics.status_round_trip.percentile(50))),
+    ("connections_per_hour", "Connections Per Hour", None,
+     lambda metrics: metrics.connections_per_hour),
+    ("connected_time", "Connected Time", UnitOfTime.SECONDS,
+     lambda metrics: round(metrics.connected_seconds)),
+    ("ble_failures", "BLE Failures", None,
+     lambda metrics: metrics.failures),
+]
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     instance: SmartMatic = config_entry.runtime_data
     async_add_entities([
-        SmartMaticBatteryVoltageSensor(instance, config_entry)
+        SmartMaticBatteryVoltageSensor(instance, config_entry),
+        SmartMaticBatteryLevelSensor(instance, config_entry),
+        SmartMaticBatteryDepletionSensor(instance, config_entry),
+        SmartMaticLinkStateSensor(instance, config_entry),
+        *[
+            SmartMaticMetricSensor(instance, config_entry, *metric)
+            for metric in METRIC_SENSORS
+        ]
     ])
 
 
 class SmartMaticBatteryVoltageSensor(SensorEntity):
+    """The raw battery voltage.
+
+    Only moves of BATTERY_VOLTAGE_DEADBAND or more are written, the
+    millivolt jitter in between is kept out of the recorder. The hourly
+    min/mean/max go to the long-term statistics instead, see
+    battery_statistics.py.
+    """
+
     _attr_name = "SmartMatic Battery Voltage"
     _attr_native_unit_of_measurement = UnitOfElectricPotential.MILLIVOLT
     _attr_icon = "mdi:battery"
@@ -25,16 +64,180 @@ class SmartMaticBatteryVoltageSensor(SensorEntity):
         self._instance: SmartMatic = instance
         self._config_entry = config_entry
         self._attr_unique_id = f"{config_entry.entry_id}_battery_voltage"
+        if instance.device_status is not None:
+            self._attr_native_value = instance.device_status.battery_mv
 
-        instance.eventbus.add_listener(
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(self._instance.eventbus.add_listener(
             DEVICE_STATUS_UPDATE,
             self.on_status_update
-        )
+        ))
 
     @property
     def device_info(self) -> DeviceInfo:
         return async_device_device_info_fn(self._instance, self._config_entry.data[CONF_NAME])
 
-    async def on_status_update(self, device_status: DeviceStatus):
+    @callback
+    def on_status_update(self, device_status: DeviceStatus):
+        if device_status.battery_mv is None:
+            return
+        if self._attr_native_value is not None and \
+                abs(device_status.battery_mv - self._attr_native_value) < BATTERY_VOLTAGE_DEADBAND:
+            return
         self._attr_native_value = device_status.battery_mv
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
+
+
+class SmartMaticBatteryLevelSensor(SensorEntity):
+    """Remaining battery capacity estimated from the voltage, in steps of BATTERY_LEVEL_STEP."""
+
+    _attr_device_class = SensorDeviceClass.BATTERY
+    _attr_native_unit_of_measurement = PERCENTAGE
+
+    def __init__(self, instance: SmartMatic, config_entry: ConfigEntry):
+        self._instance: SmartMatic = instance
+        self._config_entry = config_entry
+        self._attr_name = f"{config_entry.data[CONF_NAME]} Battery"
+        self._attr_unique_id = f"{config_entry.entry_id}_battery_level"
+        if instance.device_status is not None and instance.device_status.battery_mv is not None:
+            self._attr_native_value = self._level(instance.device_status.battery_mv)
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(self._instance.eventbus.add_listener(
+            DEVICE_STATUS_UPDATE,
+            self.on_status_update
+        ))
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return async_device_device_info_fn(self._instance, self._config_entry.data[CONF_NAME])
+
+    @staticmethod
+    def _level(battery_mv: int) -> int:
+        return round(battery_level(battery_mv) / BATTERY_LEVEL_STEP) * BATTERY_LEVEL_STEP
+
+    @callback
+    def on_status_update(self, device_status: DeviceStatus):
+        if device_status.battery_mv is None:
+            return
+        level = self._level(device_status.battery_mv)
+        if level == self._attr_native_value:
+            return
+        self._attr_native_value = level
+        self.async_write_ha_state()
+
+
+class SmartMaticBatteryDepletionSensor(SensorEntity):
+    """Days until the battery is empty at the recent rate of discharge."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.DAYS
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:battery-clock"
+
+    def __init__(self, instance: SmartMatic, config_entry: ConfigEntry):
+        self._instance: SmartMatic = instance
+        self._config_entry = config_entry
+        self._attr_name = f"{config_entry.data[CONF_NAME]} Battery Depletion"
+        self._attr_unique_id = f"{config_entry.entry_id}_battery_depletion"
+        self._attr_native_value = self._days()
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(self._instance.eventbus.add_listener(
+            DEVICE_STATUS_UPDATE,
+            self.on_status_update
+        ))
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return async_device_device_info_fn(self._instance, self._config_entry.data[CONF_NAME])
+
+    def _days(self) -> int | None:
+        eta = self._instance.battery.depletion_eta()
+        return None if eta is None else round(eta / timedelta(days=1))
+
+    @callback
+    def on_status_update(self, _device_status: DeviceStatus):
+        days = self._days()
+        if days == self._attr_native_value:
+            return
+        self._attr_native_value = days
+        self.async_write_ha_state()
+
+
+class SmartMaticLinkStateSensor(SensorEntity):
+    """Circuit breaker state of the connection to a Smart Matic."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = STATES
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:connection"
+
+    def __init__(self, instance: SmartMatic, config_entry: ConfigEntry):
+        self._instance: SmartMatic = instance
+        self._config_entry = config_entry
+        self._attr_name = f"{config_entry.data[CONF_NAME]} Link State"
+        self._attr_unique_id = f"{config_entry.entry_id}_link_state"
+        self._attr_native_value = instance.retry_policy.state
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(self._instance.eventbus.add_listener(
+            DEVICE_LINK_STATE,
+            self.on_link_state
+        ))
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return async_device_device_info_fn(self._instance, self._config_entry.data[CONF_NAME])
+
+    @property
+    def extra_state_attributes(self):
+        return self._instance.retry_policy.as_dict()
+
+    @callback
+    def on_link_state(self, retry_policy: RetryPolicy):
+        self._attr_native_value = retry_policy.state
+        self.async_write_ha_state()
+
+
+class SmartMaticMetricSensor(SensorEntity):
+    """A BLE performance figure, refreshed once per connection."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(
+        self,
+        instance: SmartMatic,
+        config_entry: ConfigEntry,
+        key: str,
+        name: str,
+        unit: str | None,
+        value_fn
+    ):
+        self._instance: SmartMatic = instance
+        self._config_entry = config_entry
+        self._value_fn = value_fn
+        self._attr_name = f"{config_entry.data[CONF_NAME]} {name}"
+        self._attr_unique_id = f"{config_entry.entry_id}_{key}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_native_value = value_fn(instance.metrics)
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(self._instance.eventbus.add_listener(
+            DEVICE_DISCONNECT,
+            self.on_disconnect
+        ))
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return async_device_device_info_fn(self._instance, self._config_entry.data[CONF_NAME])
+
+    @callback
+    def on_disconnect(self, instance: SmartMatic):
+        value = self._value_fn(instance.metrics)
+        if value == self._attr_native_value:
+            return
+        self._attr_native_value = value
+        self.async_write_ha_state()
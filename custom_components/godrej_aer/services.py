@@ -0,0 +1,179 @@
+"""Services of the Godrej Aer Smart Matic integration."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_NAME
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_extract_config_entry_ids
+
+from .const import DOMAIN
+from .godrej import SmartMatic, protocol
+from .godrej.exception import SmartMaticError
+from .godrej.fleet import DEFAULT_MAX_PARALLEL, trigger_all
+from .godrej.tracing import Tracer
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_TRIGGER_GROUP = "trigger_group"
+SERVICE_SEND_COMMAND = "send_command"
+SERVICE_EXPORT_TRACE = "export_trace"
+ATTR_MAX_PARALLEL = "max_parallel"
+ATTR_READ_STATUS = "read_status"
+ATTR_MESSAGE_TYPE = "message_type"
+ATTR_MESSAGE_NUMBER = "message_number"
+ATTR_FIELDS = "fields"
+ATTR_WAIT_FOR_REPLY = "wait_for_reply"
+ATTR_CLEAR = "clear"
+
+TRIGGER_GROUP_SCHEMA = cv.make_entity_service_schema({
+    vol.Optional(ATTR_MAX_PARALLEL, default=DEFAULT_MAX_PARALLEL): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=64)
+    ),
+    vol.Optional(ATTR_READ_STATUS, default=False): cv.boolean
+})
+
+SEND_COMMAND_SCHEMA = cv.make_entity_service_schema({
+    vol.Required(ATTR_MESSAGE_TYPE): vol.All(vol.Coerce(int), vol.Range(min=0, max=255)),
+    vol.Required(ATTR_MESSAGE_NUMBER): vol.All(vol.Coerce(int), vol.Range(min=0, max=255)),
+    vol.Optional(ATTR_FIELDS, default={}): {cv.string: vol.Any(int, float, str, bool)},
+    vol.Optional(ATTR_WAIT_FOR_REPLY, default=True): cv.boolean
+})
+
+EXPORT_TRACE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CLEAR, default=True): cv.boolean
+})
+
+
+async def _async_loaded_entries(hass: HomeAssistant, call: ServiceCall) -> list:
+    """The loaded Smart Matic entries behind the devices, entities, areas, floors or labels targeted."""
+    entries = [
+        entry
+        for entry_id in await async_extract_config_entry_ids(hass, call)
+        if (entry := hass.config_entries.async_get_entry(entry_id)) is not None
+        and entry.domain == DOMAIN
+        and entry.state is ConfigEntryState.LOADED
+    ]
+    if not entries:
+        raise ServiceValidationError("No loaded Smart Matic devices selected")
+    return entries
+
+
+def _json_safe(value):
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value).hex()
+    if isinstance(value, dict):
+        return {str(key): _json_safe(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_json_safe(item) for item in value]
+    return value
+
+
+async def _async_send_command(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    entries = await _async_loaded_entries(hass, call)
+    if len(entries) > 1:
+        raise ServiceValidationError("send_command targets a single device")
+    smartmatic: SmartMatic = entries[0].runtime_data
+
+    try:
+        frame = await smartmatic.send_command(
+            call.data[ATTR_MESSAGE_TYPE],
+            call.data[ATTR_MESSAGE_NUMBER],
+            call.data[ATTR_FIELDS],
+            wait_for_reply=call.data[ATTR_WAIT_FOR_REPLY]
+        )
+    except SmartMaticError as e:
+        raise HomeAssistantError(str(e)) from e
+
+    if frame is None:
+        return {"frame": None, "reply": None}
+    try:
+        reply = _json_safe(protocol.decode(frame))
+    except protocol.CBORDecodeError:
+        reply = None
+    return {"frame": frame.hex(), "reply": reply}
+
+
+async def _async_trigger_group(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    entries = await _async_loaded_entries(hass, call)
+    smartmatics: list[SmartMatic] = [entry.runtime_data for entry in entries]
+    results = await trigger_all(
+        smartmatics,
+        max_parallel=call.data[ATTR_MAX_PARALLEL],
+        read_status=call.data[ATTR_READ_STATUS]
+    )
+    _LOGGER.debug(
+        "Group trigger: %s of %s devices succeeded",
+        sum(result.success for result in results), len(results)
+    )
+    return {
+        "devices": {
+            entry.data[CONF_NAME]: result.as_dict()
+            for entry, result in zip(entries, results)
+        }
+    }
+
+
+async def _async_export_trace(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    tracer: Tracer | None = hass.data.get(DOMAIN, {}).get("tracer")
+    if tracer is None or not tracer.spans:
+        raise ServiceValidationError("No spans recorded, turn tracing on in a device's options")
+
+    path = hass.config.path(
+        DOMAIN, f"trace-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    summary = tracer.summary()
+    spans = len(tracer.spans)
+    await hass.async_add_executor_job(tracer.write_chrome_trace, path)
+    if call.data[ATTR_CLEAR]:
+        tracer.clear()
+    _LOGGER.info("Wrote %s spans to %s", spans, path)
+    return {"path": path, "spans": spans, "summary": summary}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant):
+    async def trigger_group(call: ServiceCall) -> ServiceResponse:
+        return await _async_trigger_group(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_TRIGGER_GROUP,
+        trigger_group,
+        schema=TRIGGER_GROUP_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL
+    )
+
+    async def send_command(call: ServiceCall) -> ServiceResponse:
+        return await _async_send_command(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_COMMAND,
+        send_command,
+        schema=SEND_COMMAND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL
+    )
+
+    async def export_trace(call: ServiceCall) -> ServiceResponse:
+        return await _async_export_trace(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_TRACE,
+        export_trace,
+        schema=EXPORT_TRACE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL
+    )
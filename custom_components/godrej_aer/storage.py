@@ -0,0 +1,52 @@
+"""Persistent per-device state for the Godrej Aer Smart Matic integration."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.devices"
+SAVE_DELAY = 10
+
+
+class SmartMaticStorage:
+    """Keeps a small dict per MAC address in .storage, saved lazily."""
+
+    def __init__(self, hass: HomeAssistant):
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._devices: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self):
+        self._devices = await self._store.async_load() or {}
+
+    def get(self, mac: str, key: str, default: Any = None) -> Any:
+        return self._devices.get(mac, {}).get(key, default)
+
+    def set(self, mac: str, key: str, value: Any):
+        self._devices.setdefault(mac, {})[key] = value
+        self._store.async_delay_save(lambda: self._devices, SAVE_DELAY)
+
+    def remove(self, mac: str):
+        if self._devices.pop(mac, None) is not None:
+            self._store.async_delay_save(lambda: self._devices, SAVE_DELAY)
+
+
+async def _async_load_storage(hass: HomeAssistant) -> SmartMaticStorage:
+    storage = SmartMaticStorage(hass)
+    await storage.async_load()
+    return storage
+
+
+async def async_get_storage(hass: HomeAssistant) -> SmartMaticStorage:
+    """Return the storage shared by all config entries, loading it once."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "storage" not in domain_data:
+        domain_data["storage"] = hass.async_create_task(_async_load_storage(hass))
+    return await asyncio.shield(domain_data["storage"])
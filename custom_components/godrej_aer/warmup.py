@@ -0,0 +1,87 @@
+"""Staggered start of the Smart Matic pollers."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.start import async_at_started
+
+from .const import (
+    DOMAIN,
+    CONF_WARMUP_WINDOW,
+    DEFAULT_WARMUP_WINDOW,
+    WARMUP_GATHER_DELAY
+)
+from .coordinator import SmartMaticCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WarmupPlanner:
+    """Spreads the first poll of every device over a warm-up window.
+
+    Coordinators registered during setup are only started once Home
+    Assistant is running. The most stale devices, and among those the ones
+    with the strongest signal, get the earliest slots, so the proxies never
+    see the whole fleet connecting at once.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._pending: list[SmartMaticCoordinator] = []
+        self._waiting_for_start = False
+        self._cancel_gather = None
+
+    @callback
+    def async_register(self, coordinator: SmartMaticCoordinator):
+        self._pending.append(coordinator)
+        if not self._waiting_for_start:
+            self._waiting_for_start = True
+            async_at_started(self.hass, self._async_hass_started)
+
+    @callback
+    def async_unregister(self, coordinator: SmartMaticCoordinator):
+        if coordinator in self._pending:
+            self._pending.remove(coordinator)
+
+    @callback
+    def _async_hass_started(self, _hass: HomeAssistant):
+        self._waiting_for_start = False
+        # Give entries that are still being set up a moment to register
+        if self._cancel_gather is None:
+            self._cancel_gather = async_call_later(
+                self.hass, WARMUP_GATHER_DELAY, self._async_plan
+            )
+
+    @callback
+    def _async_plan(self, _now: datetime):
+        self._cancel_gather = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        window = max(
+            coordinator.entry.options.get(CONF_WARMUP_WINDOW, DEFAULT_WARMUP_WINDOW)
+            for coordinator in pending
+        )
+        pending.sort(key=lambda coordinator: (
+            -coordinator.staleness,
+            -(coordinator.rssi if coordinator.rssi is not None else -127)
+        ))
+
+        step = window / len(pending)
+        for index, coordinator in enumerate(pending):
+            _LOGGER.debug(
+                "First poll of %s in %.0fs", coordinator.instance.mac, index * step
+            )
+            coordinator.async_start(first_poll_in=index * step)
+
+
+@callback
+def async_get_warmup_planner(hass: HomeAssistant) -> WarmupPlanner:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "warmup" not in domain_data:
+        domain_data["warmup"] = WarmupPlanner(hass)
+    return domain_data["warmup"]
@@ -0,0 +1,5 @@
+"""Tests of the godrej package, which runs without Home Assistant."""
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components" / "godrej_aer"))
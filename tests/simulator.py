@@ -0,0 +1,214 @@
+"""A simulated Smart Matic, for testing and measuring the client code without hardware.
+
+FakeBleakClient stands in for a BleakClient connected to a
+FakeSmartMaticDevice. The device answers the status request and trigger
+commands on WRITE_CHAR with notifications on NOTIFY_CHAR, and can be told
+to connect slowly, fragment notifications to a small MTU, drop
+notifications or lose the link.
+"""
+import asyncio
+import random
+
+from bleak import BleakError
+
+from godrej import protocol
+from godrej.const import ATT_HEADER_SIZE, MAIN_SVC, NOTIFY_CHAR, WRITE_CHAR
+from godrej.devicestatus import STATUS_FRAME_LENGTH
+from godrej.godrej import SmartMatic
+from godrej.resolver import StaticResolver
+
+
+def status_frame(battery_mv: int, message_number: int = 157) -> bytes:
+    """A status frame laid out the way DeviceStatus expects it.
+
+    The real frame's fields are not documented, only the battery voltage
+    position is; the rest is filler that keeps the frame at 99 bytes.
+    """
+    head = protocol.encode({"mT": 108, "mN": message_number, "sV": 0x0100, "bV": 0})
+    # head ends with the 0x00 battery placeholder and the map break
+    frame = bytearray(head[:-2])
+    frame += b"\x1a" + battery_mv.to_bytes(4, "big")
+    filler = STATUS_FRAME_LENGTH - len(frame) - 1 - 3 - 2
+    frame += protocol.encode("pd") + bytes([0x58, filler]) + bytes(filler)
+    frame.append(protocol.BREAK)
+    return bytes(frame)
+
+
+class FakeCharacteristic:
+    def __init__(self, uuid: str, properties: list[str]):
+        self.uuid = uuid
+        self.properties = properties
+
+    def __repr__(self):
+        return f"<FakeCharacteristic {self.uuid}>"
+
+
+class FakeService:
+    def __init__(self, uuid: str, characteristics: list[FakeCharacteristic]):
+        self.uuid = uuid
+        self.characteristics = characteristics
+
+
+class FakeServiceCollection:
+    def __init__(self):
+        self._characteristics = {
+            NOTIFY_CHAR: FakeCharacteristic(NOTIFY_CHAR, ["notify"]),
+            WRITE_CHAR: FakeCharacteristic(WRITE_CHAR, ["write", "write-without-response"])
+        }
+        self._services = {
+            MAIN_SVC: FakeService(MAIN_SVC, list(self._characteristics.values()))
+        }
+
+    def __iter__(self):
+        return iter(self._services.values())
+
+    def get_service(self, uuid: str):
+        return self._services.get(uuid)
+
+    def get_characteristic(self, uuid: str):
+        return self._characteristics.get(uuid)
+
+
+class FakeSmartMaticDevice:
+    """The device side of the simulation, also usable as the BLEDevice."""
+
+    def __init__(
+        self,
+        address: str,
+        battery_mv: int = 3000,
+        source: str = "simulated",
+        rssi: int = -60,
+        connect_delay: float = 0.05,
+        response_delay: float = 0.02,
+        write_delay: float = 0.005,
+        mtu: int = 23,
+        drop_rate: float = 0.0,
+        disconnect_rate: float = 0.0,
+        seed: int | None = None
+    ):
+        self.address = address
+        self.name = "Smart Matic"
+        self.battery_mv = battery_mv
+        self.source = source
+        self.rssi = rssi
+        self.connect_delay = connect_delay
+        self.response_delay = response_delay
+        self.write_delay = write_delay
+        self.mtu = mtu
+        self.drop_rate = drop_rate
+        self.disconnect_rate = disconnect_rate
+        self.random = random.Random(seed)
+
+        self.details = {"source": source}
+        self.triggers = 0
+        self.connections = 0
+        self.writes: list[bytes] = []
+
+    def responses(self, data: bytes) -> list[bytes]:
+        """The frames the device sends back for a write."""
+        self.writes.append(bytes(data))
+        try:
+            command = protocol.decode(data)
+        except protocol.CBORDecodeError:
+            return []
+
+        if command.get(protocol.MESSAGE_TYPE) == 104:
+            self.triggers += 1
+            return []
+        if command.get(protocol.MESSAGE_TYPE) == 107:
+            return [status_frame(self.battery_mv)]
+        return []
+
+    def fragments(self, frame: bytes) -> list[bytes]:
+        size = max(1, self.mtu - ATT_HEADER_SIZE)
+        return [frame[i:i + size] for i in range(0, len(frame), size)]
+
+
+class FakeBleakClient:
+    """Stands in for a BleakClient talking to a FakeSmartMaticDevice."""
+
+    def __init__(self, device: FakeSmartMaticDevice, disconnected_callback=None):
+        self.device = device
+        self.address = device.address
+        self.services = FakeServiceCollection()
+        self._disconnected_callback = disconnected_callback
+        self._connected = False
+        self._notify_callback = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    @property
+    def mtu_size(self) -> int:
+        return self.device.mtu
+
+    async def connect(self, **kwargs) -> bool:
+        await asyncio.sleep(self.device.connect_delay)
+        self._connected = True
+        self.device.connections += 1
+        return True
+
+    async def disconnect(self) -> bool:
+        if not self._connected:
+            return True
+        self._connected = False
+        for task in self._tasks:
+            task.cancel()
+        if self._disconnected_callback is not None:
+            self._disconnected_callback(self)
+        return True
+
+    async def clear_cache(self) -> bool:
+        return True
+
+    async def start_notify(self, characteristic, callback, **kwargs):
+        self._require_connection()
+        self._notify_callback = callback
+
+    async def stop_notify(self, characteristic):
+        self._notify_callback = None
+
+    async def write_gatt_char(self, characteristic, data, response: bool | None = None):
+        self._require_connection()
+        if response is not False:
+            await asyncio.sleep(self.device.write_delay)
+
+        if self.device.random.random() < self.device.disconnect_rate:
+            await self.disconnect()
+            raise BleakError("Simulated link loss")
+
+        frames = self.device.responses(data)
+        if frames:
+            task = asyncio.get_running_loop().create_task(self._notify(frames))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _notify(self, frames: list[bytes]):
+        await asyncio.sleep(self.device.response_delay)
+        characteristic = self.services.get_characteristic(NOTIFY_CHAR)
+        for frame in frames:
+            for fragment in self.device.fragments(frame):
+                if self.device.random.random() < self.device.drop_rate:
+                    continue
+                if self._notify_callback is None or not self._connected:
+                    return
+                await self._notify_callback(characteristic, bytearray(fragment))
+
+    def _require_connection(self):
+        if not self._connected:
+            raise BleakError("Not connected")
+
+
+class SimulatedSmartMatic(SmartMatic):
+    """SmartMatic wired to a FakeSmartMaticDevice instead of Bluetooth."""
+
+    def __init__(self, device: FakeSmartMaticDevice, scheduler=None, slots: int | None = None):
+        super().__init__(StaticResolver([device], slots=slots), device.address, scheduler)
+        self.device = device
+
+    async def _establish_client(self, route):
+        client = FakeBleakClient(route.device, disconnected_callback=self._on_disconnect)
+        await client.connect()
+        return client
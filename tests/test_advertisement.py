@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+
+from godrej.advertisement import parse_advertisement
+from godrej.const import MAIN_SVC
+
+from .simulator import status_frame
+
+
+def _service_info(manufacturer_data=None, service_data=None):
+    return SimpleNamespace(
+        manufacturer_data=manufacturer_data or {},
+        service_data=service_data or {}
+    )
+
+
+def test_status_in_service_data():
+    device_status = parse_advertisement(_service_info(service_data={MAIN_SVC: status_frame(2900)}))
+    assert device_status.battery_mv == 2900
+
+
+def test_status_in_manufacturer_data():
+    device_status = parse_advertisement(_service_info(manufacturer_data={0x0D00: status_frame(2900)}))
+    assert device_status.battery_mv == 2900
+
+
+def test_foreign_payload_is_ignored():
+    assert parse_advertisement(_service_info(manufacturer_data={0x004C: bytes(99)})) is None
+    assert parse_advertisement(_service_info(manufacturer_data={0x004C: b"\x02\x15"})) is None
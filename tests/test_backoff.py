@@ -0,0 +1,88 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from godrej.backoff import RetryPolicy, STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN
+from godrej.exception import BackingOffError, ConnectionError
+
+from .simulator import FakeSmartMaticDevice, SimulatedSmartMatic
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_backoff_grows():
+    clock = Clock()
+    policy = RetryPolicy(base_delay=5, jitter=0, failure_threshold=10, clock=clock)
+    policy.record_failure("first")
+    assert policy.retry_in == 5
+    assert not policy.allow_attempt()
+    policy.record_failure("second")
+    assert policy.retry_in == 10
+    clock.now = 10
+    assert policy.allow_attempt()
+
+
+def test_circuit_opens_and_half_opens():
+    clock = Clock()
+    policy = RetryPolicy(base_delay=0, failure_threshold=3, strong_rssi=-80, max_delay=900, clock=clock)
+    for _ in range(3):
+        policy.record_failure()
+    assert policy.state == STATE_OPEN
+    assert not policy.allow_attempt()
+
+    policy.on_advertisement(-95)
+    assert policy.state == STATE_OPEN
+    policy.on_advertisement(-70)
+    assert policy.state == STATE_HALF_OPEN
+    assert policy.allow_attempt()
+
+
+def test_weak_advertisement_half_opens_after_max_delay():
+    clock = Clock()
+    policy = RetryPolicy(base_delay=0, failure_threshold=1, max_delay=60, clock=clock)
+    policy.record_failure()
+    clock.now = 61
+    policy.on_advertisement(-99)
+    assert policy.state == STATE_HALF_OPEN
+
+
+def test_half_open_outcome():
+    policy = RetryPolicy(base_delay=0, failure_threshold=1)
+    policy.record_failure()
+    policy.on_advertisement(-50)
+    policy.record_failure()
+    assert policy.state == STATE_OPEN
+
+    policy.on_advertisement(-50)
+    policy.record_success()
+    assert policy.state == STATE_CLOSED
+    assert policy.failures == 0
+
+
+def test_smartmatic_recovers_from_advertisement():
+    async def run():
+        device = FakeSmartMaticDevice("AA:BB:CC:DD:EE:01", disconnect_rate=1.0, seed=1)
+        smartmatic = SimulatedSmartMatic(device)
+        smartmatic.retry_policy.base_delay = 0
+        for _ in range(smartmatic.retry_policy.failure_threshold):
+            with pytest.raises(ConnectionError):
+                await smartmatic.connect()
+        assert smartmatic.retry_policy.state == STATE_OPEN
+        with pytest.raises(BackingOffError):
+            await smartmatic.connect()
+
+        device.disconnect_rate = 0.0
+        smartmatic.process_advertisement(SimpleNamespace(rssi=-50))
+        assert smartmatic.retry_policy.state == STATE_HALF_OPEN
+        assert await smartmatic.connect()
+        assert smartmatic.retry_policy.state == STATE_CLOSED
+        await smartmatic.close()
+
+    asyncio.run(run())
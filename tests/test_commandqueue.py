@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from godrej.backoff import STATE_CLOSED
+from godrej.commandqueue import CommandQueue
+from godrej.exception import UnconfirmedCommandError
+
+from .simulator import FakeSmartMaticDevice, SimulatedSmartMatic
+
+
+def test_commands_run_in_order():
+    async def run():
+        executed = []
+
+        async def executor(name, *args):
+            executed.append((name, args))
+            await asyncio.sleep(0.01)
+
+        queue = CommandQueue(executor)
+        await asyncio.gather(queue.submit("a"), queue.submit("b", 1), queue.submit("c"))
+        assert executed == [("a", ()), ("b", (1,)), ("c", ())]
+
+    asyncio.run(run())
+
+
+def test_queued_duplicates_coalesce():
+    async def run():
+        executed = []
+
+        async def executor(name):
+            executed.append(name)
+            await asyncio.sleep(0.01)
+
+        queue = CommandQueue(executor)
+        results = await asyncio.gather(
+            queue.submit("status", coalesce=True),
+            queue.submit("status", coalesce=True),
+            queue.submit("status", coalesce=True)
+        )
+        assert executed == ["status"]
+        assert [result.coalesced for result in results] == [False, True, True]
+
+    asyncio.run(run())
+
+
+def test_coalesce_window():
+    async def run():
+        executed = []
+
+        async def executor(name):
+            executed.append(name)
+
+        queue = CommandQueue(executor, coalesce_window=60)
+        await queue.submit("trigger", coalesce=True)
+        result = await queue.submit("trigger", coalesce=True)
+        assert result.coalesced
+        await queue.submit("trigger")
+        assert executed == ["trigger", "trigger"]
+
+        queue.coalesce_window = 0
+        await queue.submit("trigger", coalesce=True)
+        assert len(executed) == 3
+
+    asyncio.run(run())
+
+
+def test_errors_reach_the_submitter():
+    async def run():
+        async def executor(name):
+            raise ValueError(name)
+
+        queue = CommandQueue(executor)
+        with pytest.raises(ValueError):
+            await queue.submit("broken")
+        assert queue.results[-1].error == "broken"
+
+    asyncio.run(run())
+
+
+def test_smartmatic_commands_share_the_queue():
+    async def run():
+        device = FakeSmartMaticDevice("AA:BB:CC:DD:EE:01")
+        smartmatic = SimulatedSmartMatic(device)
+        results = await asyncio.gather(
+            smartmatic.trigger(read_status=True),
+            smartmatic.send_command(107, 157),
+            smartmatic.refresh_status()
+        )
+        assert device.triggers == 1
+        assert len(results[1]) == 99
+        assert [result.command for result in smartmatic.commands.results] == [
+            "trigger_and_status", "raw", "status"
+        ]
+        await smartmatic.close()
+
+    asyncio.run(run())
+
+
+def test_unanswered_raw_commands_keep_the_circuit_closed():
+    async def run():
+        device = FakeSmartMaticDevice("AA:BB:CC:DD:EE:01")
+        smartmatic = SimulatedSmartMatic(device)
+        smartmatic.status_timeout = 0.05
+        for _ in range(smartmatic.retry_policy.failure_threshold + 1):
+            with pytest.raises(UnconfirmedCommandError):
+                await smartmatic.send_command(1, 1)
+        assert smartmatic.retry_policy.state == STATE_CLOSED
+        assert smartmatic.metrics.failures == 0
+        await smartmatic.trigger()
+        assert device.triggers == 1
+        await smartmatic.close()
+
+    asyncio.run(run())
@@ -0,0 +1,33 @@
+import asyncio
+
+from godrej.devicestatus import DeviceStatus, STATUS_FRAME_LENGTH
+from godrej.events import DEVICE_STATUS_UPDATE
+
+from .simulator import FakeSmartMaticDevice, SimulatedSmartMatic, status_frame
+
+
+def _raw_status(battery_mv: int) -> bytes:
+    return bytes(20) + b"\x1a" + battery_mv.to_bytes(4, "big") + bytes(STATUS_FRAME_LENGTH - 25)
+
+
+async def _announced(frames: list[bytes]) -> list[int]:
+    smartmatic = SimulatedSmartMatic(FakeSmartMaticDevice("AA:BB:CC:DD:EE:01"))
+    updates = []
+    smartmatic.eventbus.add_listener(
+        DEVICE_STATUS_UPDATE, lambda device_status: updates.append(device_status.battery_mv)
+    )
+    for frame in frames:
+        smartmatic.set_device_status(DeviceStatus(frame))
+        # Status updates are coalesced per event loop iteration
+        await asyncio.sleep(0)
+    return updates
+
+
+def test_unchanged_status_is_not_announced():
+    frames = [status_frame(3000), status_frame(3000), status_frame(2990)]
+    assert asyncio.run(_announced(frames)) == [3000, 2990]
+
+
+def test_non_cbor_status_change_is_announced():
+    frames = [_raw_status(3000), _raw_status(2500)]
+    assert asyncio.run(_announced(frames)) == [3000, 2500]
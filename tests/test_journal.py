@@ -0,0 +1,97 @@
+import asyncio
+import time
+
+import pytest
+
+from godrej.exception import UnconfirmedCommandError
+from godrej.journal import CommandJournal
+
+from .simulator import FakeSmartMaticDevice, SimulatedSmartMatic
+
+
+def test_duplicates_are_merged():
+    journal = CommandJournal(ttl=60)
+    journal.add("trigger")
+    journal.add("trigger")
+    journal.add("trigger_and_status")
+    assert [entry.command for entry in journal.pending()] == ["trigger", "trigger_and_status"]
+
+
+def test_expired_entries_are_dropped():
+    journal = CommandJournal(ttl=60)
+    journal.add("trigger", ttl=-1)
+    assert len(journal) == 0
+
+
+def test_round_trip():
+    changes = []
+    journal = CommandJournal(ttl=60, on_change=lambda journal: changes.append(journal.as_list()))
+    journal.add("trigger")
+    restored = CommandJournal()
+    restored.load(changes[-1])
+    assert [entry.command for entry in restored.pending()] == ["trigger"]
+
+
+def test_load_drops_expired():
+    journal = CommandJournal()
+    journal.load([{"command": "trigger", "created": 0.0, "expires": time.time() - 1}])
+    assert len(journal) == 0
+
+
+def test_missed_trigger_is_replayed():
+    async def run():
+        device = FakeSmartMaticDevice("AA:BB:CC:DD:EE:01", disconnect_rate=1.0, seed=1)
+        smartmatic = SimulatedSmartMatic(device)
+        smartmatic.retry_policy.base_delay = 0
+        smartmatic.journal = CommandJournal(ttl=60)
+
+        result = await smartmatic.trigger()
+        assert result.deferred
+        assert len(smartmatic.journal) == 1
+        assert device.triggers == 0
+
+        device.disconnect_rate = 0.0
+        assert await smartmatic.flush_journal() == 1
+        assert device.triggers == 1
+        assert len(smartmatic.journal) == 0
+        await smartmatic.close()
+
+    asyncio.run(run())
+
+
+def test_unconfirmed_trigger_is_not_journaled():
+    async def run():
+        device = FakeSmartMaticDevice("AA:BB:CC:DD:EE:01", seed=1)
+        smartmatic = SimulatedSmartMatic(device)
+        smartmatic.write_without_response = False
+        smartmatic.status_timeout = 0.1
+        smartmatic.journal = CommandJournal(ttl=60)
+
+        await smartmatic.connect()
+        device.drop_rate = 1.0
+        with pytest.raises(UnconfirmedCommandError):
+            await smartmatic.trigger(read_status=True)
+        assert device.triggers == 1
+        assert len(smartmatic.journal) == 0
+        await smartmatic.close()
+
+    asyncio.run(run())
+
+
+def test_unconfirmed_journaled_trigger_is_dropped():
+    async def run():
+        device = FakeSmartMaticDevice("AA:BB:CC:DD:EE:01", seed=1)
+        smartmatic = SimulatedSmartMatic(device)
+        smartmatic.status_timeout = 0.1
+        smartmatic.journal = CommandJournal(ttl=60)
+        smartmatic.journal.add("trigger")
+
+        await smartmatic.connect()
+        device.drop_rate = 1.0
+
+        assert await smartmatic.flush_journal() == 0
+        assert device.triggers == 1
+        assert len(smartmatic.journal) == 0
+        await smartmatic.close()
+
+    asyncio.run(run())
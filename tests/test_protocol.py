@@ -0,0 +1,41 @@
+import pytest
+
+from godrej import protocol
+from godrej.devicestatus import DeviceStatus, STATUS_FRAME_LENGTH
+
+from .simulator import status_frame
+
+
+def test_command_frames():
+    assert protocol.decode(protocol.TRIGGER) == {"mT": 104, "mN": 154, "rI": 0}
+    assert protocol.decode(protocol.STATUS_REQUEST) == {"mT": 107, "mN": 157}
+    assert protocol.command_frame(104, 154, rI=0) is protocol.TRIGGER
+
+
+def test_round_trip():
+    value = {"mT": 1, "n": -300, "b": b"\x01\x02", "l": [True, None, 1.5], "s": "text"}
+    assert protocol.decode(protocol.encode(value)) == value
+
+
+def test_frame_length():
+    frame = protocol.encode({"mT": 108, "mN": 157})
+    assert protocol.frame_length(frame + b"\xbf") == len(frame)
+    assert protocol.frame_length(frame[:-1]) is None
+
+
+def test_corrupt_frame():
+    with pytest.raises(protocol.CBORDecodeError):
+        protocol.decode(b"\xbf\x1c\xff")
+
+
+def test_status_frame():
+    frame = status_frame(2875)
+    assert len(frame) == STATUS_FRAME_LENGTH
+    device_status = DeviceStatus(frame)
+    assert device_status.battery_mv == 2875
+    assert device_status.get("mT") == 108
+
+
+def test_status_without_cbor():
+    raw = bytes(20) + b"\x1a" + (3000).to_bytes(4, "big") + bytes(STATUS_FRAME_LENGTH - 25)
+    assert DeviceStatus(raw).battery_mv == 3000
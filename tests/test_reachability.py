@@ -0,0 +1,74 @@
+from godrej.reachability import Reachability
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_hysteresis():
+    changes = []
+    reachability = Reachability(
+        reachable_rssi=-90, unreachable_rssi=-97,
+        on_change=lambda reachability: changes.append(reachability.reachable),
+        clock=Clock()
+    )
+    reachability.on_advertisement(-93)
+    assert not reachability.reachable
+
+    for _ in range(10):
+        reachability.on_advertisement(-80)
+    assert reachability.reachable
+
+    # Between the two thresholds it stays reachable
+    for _ in range(10):
+        reachability.on_advertisement(-94)
+    assert reachability.reachable
+
+    for _ in range(10):
+        reachability.on_advertisement(-100)
+    assert not reachability.reachable
+    assert changes == [True, False]
+
+
+def test_single_weak_advertisement_is_smoothed():
+    reachability = Reachability(clock=Clock())
+    for _ in range(5):
+        reachability.on_advertisement(-70)
+    reachability.on_advertisement(-100)
+    assert reachability.reachable
+
+
+def test_silence_makes_unreachable():
+    clock = Clock()
+    reachability = Reachability(unreachable_after=300, clock=clock)
+    reachability.on_advertisement(-60)
+    assert reachability.expires_in == 300
+
+    clock.now = 299
+    assert reachability.update()
+    clock.now = 300
+    assert not reachability.update()
+    assert reachability.expires_in is None
+
+
+def test_connection_proves_reachability():
+    reachability = Reachability(clock=Clock())
+    reachability.on_advertisement(-100)
+    assert not reachability.reachable
+    reachability.on_connected()
+    assert reachability.reachable
+
+
+def test_advertisement_seen_earlier():
+    clock = Clock()
+    reachability = Reachability(unreachable_after=300, clock=clock)
+    reachability.on_advertisement(-60)
+
+    clock.now = 350
+    reachability.on_advertisement(-60, seen_at=200)
+    assert reachability.reachable
+    assert reachability.expires_in == 150
@@ -0,0 +1,60 @@
+from godrej.devicestatus import STATUS_FRAME_LENGTH
+from godrej.reassembler import FrameReassembler
+
+from .simulator import status_frame
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_fragments():
+    frame = status_frame(3000)
+    reassembler = FrameReassembler()
+    fragments = [frame[i:i + 20] for i in range(0, len(frame), 20)]
+    for fragment in fragments[:-1]:
+        assert reassembler.feed(fragment) == []
+    assert reassembler.feed(fragments[-1]) == [frame]
+    assert reassembler.pending == 0
+
+
+def test_two_frames_in_one_notification():
+    frame = status_frame(3000)
+    assert FrameReassembler().feed(frame + frame) == [frame, frame]
+
+
+def test_resync_after_garbage():
+    frame = status_frame(3000)
+    reassembler = FrameReassembler()
+    assert reassembler.feed(b"\x00\x01\x02" + frame[:30]) == []
+    assert reassembler.feed(frame[30:]) == [frame]
+
+
+def test_resync_after_corrupt_frame():
+    frame = status_frame(3000)
+    assert FrameReassembler().feed(b"\xbf\x1c" + frame) == [frame]
+
+
+def test_stale_fragment_dropped():
+    frame = status_frame(3000)
+    clock = Clock()
+    reassembler = FrameReassembler(stale_after=2.0, clock=clock)
+    reassembler.feed(frame[:40])
+    clock.now = 5.0
+    assert reassembler.feed(frame[40:]) == []
+    assert reassembler.feed(frame) == [frame]
+
+
+def test_whole_non_cbor_status_passes():
+    raw = bytes(20) + b"\x1a" + (3000).to_bytes(4, "big") + bytes(STATUS_FRAME_LENGTH - 25)
+    assert FrameReassembler().feed(raw) == [raw]
+
+
+def test_oversized_frame_dropped():
+    reassembler = FrameReassembler(max_size=64)
+    reassembler.feed(b"\xbf" + b"\x61a" * 40)
+    assert reassembler.pending == 0
@@ -0,0 +1,88 @@
+import asyncio
+
+from godrej.scheduler import ConnectionScheduler
+
+from .simulator import FakeSmartMaticDevice, SimulatedSmartMatic
+
+
+def test_slots_are_limited_per_source():
+    async def run():
+        scheduler = ConnectionScheduler(default_slots=1)
+        await scheduler.acquire("proxy-a")
+        await asyncio.wait_for(scheduler.acquire("proxy-b"), 1)
+
+        waiter = asyncio.ensure_future(scheduler.acquire("proxy-a"))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        assert scheduler.usage()["proxy-a"]["waiting"] == 1
+        scheduler.release("proxy-a")
+        await asyncio.wait_for(waiter, 1)
+
+    asyncio.run(run())
+
+
+def test_idle_slot_is_yielded_to_a_waiter():
+    async def run():
+        scheduler = ConnectionScheduler(default_slots=1)
+        released = []
+        await scheduler.acquire("proxy")
+
+        def release():
+            released.append(True)
+            scheduler.release("proxy")
+
+        scheduler.set_idle("proxy", release)
+        await asyncio.wait_for(scheduler.acquire("proxy"), 1)
+        assert released == [True]
+
+    asyncio.run(run())
+
+
+def test_device_idle_after_waiter_queued():
+    async def run():
+        scheduler = ConnectionScheduler(default_slots=1)
+        await scheduler.acquire("proxy")
+        waiter = asyncio.ensure_future(scheduler.acquire("proxy"))
+        await asyncio.sleep(0)
+
+        scheduler.set_idle("proxy", lambda: scheduler.release("proxy"))
+        await asyncio.wait_for(waiter, 1)
+
+    asyncio.run(run())
+
+
+def test_busy_connection_is_not_yielded():
+    async def run():
+        scheduler = ConnectionScheduler(default_slots=1)
+        released = []
+        await scheduler.acquire("proxy")
+
+        def release():
+            released.append(True)
+
+        scheduler.set_idle("proxy", release)
+        scheduler.clear_idle("proxy", release)
+        waiter = asyncio.ensure_future(scheduler.acquire("proxy"))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        assert released == []
+        waiter.cancel()
+
+    asyncio.run(run())
+
+
+def test_kept_connection_gives_way():
+    async def run():
+        scheduler = ConnectionScheduler()
+        first = SimulatedSmartMatic(FakeSmartMaticDevice("AA:BB:CC:DD:EE:01"), scheduler, slots=1)
+        second = SimulatedSmartMatic(FakeSmartMaticDevice("AA:BB:CC:DD:EE:02"), scheduler, slots=1)
+        first.connection_policy.idle_timeout = 3600
+
+        await first.trigger()
+        assert first.client.is_connected
+        await asyncio.wait_for(second.trigger(), 5)
+        assert first.client is None or not first.client.is_connected
+        await first.close()
+        await second.close()
+
+    asyncio.run(run())